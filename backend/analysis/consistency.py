@@ -2,7 +2,7 @@
 
 import pandas as pd
 import numpy as np
-from .helpers import get_team_scores_by_week
+from .helpers import get_team_scores_by_week, get_manager_regular_season_stats
 
 
 def calculate_scoring_variance(matchups_df: pd.DataFrame) -> pd.DataFrame:
@@ -17,7 +17,7 @@ def calculate_scoring_variance(matchups_df: pd.DataFrame) -> pd.DataFrame:
     team_scores = get_team_scores_by_week(matchups_df)
     team_scores = team_scores[~team_scores["is_playoff"]]  # Regular season only
 
-    variance_stats = team_scores.groupby(["season", "team_name"]).agg({
+    variance_stats = team_scores.groupby(["season", "team_name"], observed=True).agg({
         "points_for": ["mean", "std", "min", "max", "count"],
     }).reset_index()
 
@@ -101,7 +101,7 @@ def get_consistency_rankings(matchups_df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame()
 
     # Rank within each season
-    variance["consistency_rank"] = variance.groupby("season")["cv"].rank(ascending=True)
+    variance["consistency_rank"] = variance.groupby("season", observed=True)["cv"].rank(ascending=True)
 
     return variance.sort_values(["season", "consistency_rank"])
 
@@ -115,18 +115,12 @@ def get_alltime_consistency(matchups_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with all-time consistency per team
     """
-    team_scores = get_team_scores_by_week(matchups_df)
-    team_scores = team_scores[~team_scores["is_playoff"]]
-
-    alltime = team_scores.groupby("team_name").agg({
-        "points_for": ["mean", "std", "min", "max", "count"],
-        "season": "nunique",
-    }).reset_index()
-
-    alltime.columns = [
-        "team_name", "avg_score", "std_dev", "min_score", "max_score", "total_games", "seasons"
-    ]
+    stats = get_manager_regular_season_stats(matchups_df)
+    if stats.empty:
+        return stats
 
+    alltime = stats[["team_name", "avg_score", "std_dev", "min_score", "max_score", "seasons"]].copy()
+    alltime["total_games"] = stats["games"]
     alltime["cv"] = alltime["std_dev"] / alltime["avg_score"]
     alltime["score_range"] = alltime["max_score"] - alltime["min_score"]
 
@@ -149,7 +143,7 @@ def get_boom_bust_analysis(matchups_df: pd.DataFrame) -> pd.DataFrame:
     team_scores = team_scores[~team_scores["is_playoff"]]
 
     # Calculate each team's average
-    team_avgs = team_scores.groupby("team_name")["points_for"].mean().to_dict()
+    team_avgs = team_scores.groupby("team_name", observed=True)["points_for"].mean().to_dict()
 
     team_scores["team_avg"] = team_scores["team_name"].map(team_avgs)
     team_scores["pct_of_avg"] = team_scores["points_for"] / team_scores["team_avg"]
@@ -158,7 +152,7 @@ def get_boom_bust_analysis(matchups_df: pd.DataFrame) -> pd.DataFrame:
     team_scores["is_boom"] = team_scores["pct_of_avg"] >= 1.20
     team_scores["is_bust"] = team_scores["pct_of_avg"] <= 0.80
 
-    boom_bust = team_scores.groupby("team_name").agg({
+    boom_bust = team_scores.groupby("team_name", observed=True).agg({
         "is_boom": "sum",
         "is_bust": "sum",
         "points_for": "count",
@@ -192,7 +186,7 @@ def get_scoring_distribution(matchups_df: pd.DataFrame, team_name: str = None) -
         return pd.DataFrame()
 
     percentiles = [10, 25, 50, 75, 90]
-    result = team_scores.groupby("team_name")["points_for"].describe(
+    result = team_scores.groupby("team_name", observed=True)["points_for"].describe(
         percentiles=[p/100 for p in percentiles]
     ).reset_index()
 
@@ -19,7 +19,7 @@ def get_draft_grades(drafts_df: pd.DataFrame) -> pd.DataFrame:
     drafts = drafts_df.copy()
 
     # Sum points by team and season
-    grades = drafts.groupby(["season", "team_name"]).agg({
+    grades = drafts.groupby(["season", "team_name"], observed=True).agg({
         "season_points": "sum",
         "pick": "count",
     }).reset_index()
@@ -28,7 +28,7 @@ def get_draft_grades(drafts_df: pd.DataFrame) -> pd.DataFrame:
     grades["avg_points_per_pick"] = grades["total_drafted_points"] / grades["picks"]
 
     # Rank within each season
-    grades["draft_rank"] = grades.groupby("season")["total_drafted_points"].rank(
+    grades["draft_rank"] = grades.groupby("season", observed=True)["total_drafted_points"].rank(
         ascending=False
     )
 
@@ -128,7 +128,7 @@ def get_round_performance(drafts_df: pd.DataFrame) -> pd.DataFrame:
     if drafts_df.empty or "season_points" not in drafts_df.columns:
         return pd.DataFrame()
 
-    round_stats = drafts_df.groupby("round").agg({
+    round_stats = drafts_df.groupby("round", observed=True).agg({
         "season_points": ["mean", "median", "std", "max"],
         "pick": "count",
     }).reset_index()
@@ -152,7 +152,7 @@ def get_position_draft_value(drafts_df: pd.DataFrame) -> pd.DataFrame:
     if drafts_df.empty or "season_points" not in drafts_df.columns:
         return pd.DataFrame()
 
-    position_stats = drafts_df.groupby("position").agg({
+    position_stats = drafts_df.groupby("position", observed=True).agg({
         "season_points": ["sum", "mean", "count"],
         "pick": "mean",
     }).reset_index()
@@ -195,7 +195,7 @@ def get_team_draft_history(drafts_df: pd.DataFrame) -> pd.DataFrame:
     if drafts_df.empty or "season_points" not in drafts_df.columns:
         return pd.DataFrame()
 
-    team_history = drafts_df.groupby("team_name").agg({
+    team_history = drafts_df.groupby("team_name", observed=True).agg({
         "season_points": ["sum", "mean"],
         "season": "nunique",
         "pick": "count",
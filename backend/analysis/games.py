@@ -1,8 +1,20 @@
 """Game analysis - blowouts and close games."""
 
+import numpy as np
 import pandas as pd
 
 
+def _annotate_winners(df: pd.DataFrame) -> pd.DataFrame:
+    """Add margin/winner/loser columns with one vectorized pass."""
+    t1_won = df["score1"].to_numpy() > df["score2"].to_numpy()
+    df["margin"] = (df["score1"] - df["score2"]).abs()
+    df["winner"] = np.where(t1_won, df["team1_name"], df["team2_name"])
+    df["loser"] = np.where(t1_won, df["team2_name"], df["team1_name"])
+    df["winner_score"] = np.where(t1_won, df["score1"], df["score2"])
+    df["loser_score"] = np.where(t1_won, df["score2"], df["score1"])
+    return df
+
+
 def get_biggest_blowouts(
     matchups_df: pd.DataFrame,
     top_n: int = 25,
@@ -25,26 +37,8 @@ def get_biggest_blowouts(
     if not include_playoffs:
         df = df[~df["is_playoff"]]
 
-    # Calculate margin
-    df["margin"] = abs(df["score1"] - df["score2"])
-
-    # Determine winner and loser
-    df["winner"] = df.apply(
-        lambda x: x["team1_name"] if x["score1"] > x["score2"] else x["team2_name"],
-        axis=1,
-    )
-    df["loser"] = df.apply(
-        lambda x: x["team2_name"] if x["score1"] > x["score2"] else x["team1_name"],
-        axis=1,
-    )
-    df["winner_score"] = df.apply(
-        lambda x: x["score1"] if x["score1"] > x["score2"] else x["score2"],
-        axis=1,
-    )
-    df["loser_score"] = df.apply(
-        lambda x: x["score2"] if x["score1"] > x["score2"] else x["score1"],
-        axis=1,
-    )
+    # Margin, winner, and loser in one vectorized pass
+    df = _annotate_winners(df)
 
     blowouts = df.nlargest(top_n, "margin")[
         ["season", "week", "winner", "loser", "winner_score", "loser_score", "margin", "is_playoff"]
@@ -75,29 +69,11 @@ def get_closest_games(
     if not include_playoffs:
         df = df[~df["is_playoff"]]
 
-    # Filter out ties (margin = 0) unless they're actual games
-    df["margin"] = abs(df["score1"] - df["score2"])
-
     # Filter out incomplete games (both scores 0)
     df = df[(df["score1"] > 0) | (df["score2"] > 0)]
 
-    # Determine winner and loser
-    df["winner"] = df.apply(
-        lambda x: x["team1_name"] if x["score1"] > x["score2"] else x["team2_name"],
-        axis=1,
-    )
-    df["loser"] = df.apply(
-        lambda x: x["team2_name"] if x["score1"] > x["score2"] else x["team1_name"],
-        axis=1,
-    )
-    df["winner_score"] = df.apply(
-        lambda x: x["score1"] if x["score1"] > x["score2"] else x["score2"],
-        axis=1,
-    )
-    df["loser_score"] = df.apply(
-        lambda x: x["score2"] if x["score1"] > x["score2"] else x["score1"],
-        axis=1,
-    )
+    # Margin, winner, and loser in one vectorized pass
+    df = _annotate_winners(df)
 
     closest = df.nsmallest(top_n, "margin")[
         ["season", "week", "winner", "loser", "winner_score", "loser_score", "margin", "is_playoff"]
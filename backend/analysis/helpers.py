@@ -1,8 +1,15 @@
 """Helper functions for analysis modules."""
 
+import numpy as np
 import pandas as pd
 
 
+# Last (input frame, result) pair. Every section of a report passes the same
+# matchups_df object, so an identity check makes repeat calls free; callers
+# never mutate the shared result in place (they filter first).
+_last_scores = (None, None)
+
+
 def get_team_scores_by_week(matchups_df: pd.DataFrame) -> pd.DataFrame:
     """Convert matchups to individual team scores per week.
 
@@ -13,37 +20,89 @@ def get_team_scores_by_week(matchups_df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with columns: season, week, team_id, team_name, points_for,
                                 points_against, won, is_playoff
     """
-    rows = []
-
-    for _, m in matchups_df.iterrows():
-        # Team 1's perspective
-        rows.append({
-            "season": m["season"],
-            "week": m["week"],
-            "team_id": m["team1_id"],
-            "team_name": m["team1_name"],
-            "opponent_id": m["team2_id"],
-            "opponent_name": m["team2_name"],
-            "points_for": m["score1"],
-            "points_against": m["score2"],
-            "won": m["score1"] > m["score2"],
-            "is_playoff": m.get("is_playoff", False),
-            "is_championship": m.get("is_championship", False),
-        })
-
-        # Team 2's perspective
-        rows.append({
-            "season": m["season"],
-            "week": m["week"],
-            "team_id": m["team2_id"],
-            "team_name": m["team2_name"],
-            "opponent_id": m["team1_id"],
-            "opponent_name": m["team1_name"],
-            "points_for": m["score2"],
-            "points_against": m["score1"],
-            "won": m["score2"] > m["score1"],
-            "is_playoff": m.get("is_playoff", False),
-            "is_championship": m.get("is_championship", False),
-        })
-
-    return pd.DataFrame(rows)
+    global _last_scores
+    cached_input, cached_result = _last_scores
+    if cached_input is matchups_df:
+        return cached_result
+
+    if matchups_df.empty:
+        return pd.DataFrame()
+
+    # Build both perspectives column-wise from array views instead of a
+    # per-row dict append; the two halves are simply stacked
+    n = len(matchups_df)
+
+    def col(name, default=False):
+        if name in matchups_df.columns:
+            return matchups_df[name].to_numpy()
+        return np.full(n, default)
+
+    season = col("season")
+    week = col("week")
+    t1_id = col("team1_id")
+    t2_id = col("team2_id")
+    t1_name = col("team1_name")
+    t2_name = col("team2_name")
+    s1 = col("score1")
+    s2 = col("score2")
+    is_playoff = col("is_playoff", False)
+    is_championship = col("is_championship", False)
+
+    result = pd.DataFrame({
+        "season": np.concatenate([season, season]),
+        "week": np.concatenate([week, week]),
+        "team_id": np.concatenate([t1_id, t2_id]),
+        "team_name": np.concatenate([t1_name, t2_name]),
+        "opponent_id": np.concatenate([t2_id, t1_id]),
+        "opponent_name": np.concatenate([t2_name, t1_name]),
+        "points_for": np.concatenate([s1, s2]),
+        "points_against": np.concatenate([s2, s1]),
+        "won": np.concatenate([s1 > s2, s2 > s1]),
+        "is_playoff": np.concatenate([is_playoff, is_playoff]),
+        "is_championship": np.concatenate([is_championship, is_championship]),
+    }, copy=False)
+    _last_scores = (matchups_df, result)
+    return result
+
+
+# Same memo pattern for the fused per-manager aggregates below.
+_last_manager_stats = (None, None)
+
+
+def get_manager_regular_season_stats(matchups_df: pd.DataFrame) -> pd.DataFrame:
+    """All-time regular-season aggregates per manager from one fused groupby.
+
+    The scoring-leader, win-leader, and consistency sections each need a
+    subset of these columns; computing them together means one hashed pass
+    over the scores instead of three.
+
+    Returns:
+        DataFrame with team_name, total_points, games, wins, losses, win_pct,
+        ppg, avg_score, std_dev, min_score, max_score, seasons
+    """
+    global _last_manager_stats
+    cached_input, cached_result = _last_manager_stats
+    if cached_input is matchups_df:
+        return cached_result
+
+    team_scores = get_team_scores_by_week(matchups_df)
+    if team_scores.empty:
+        return pd.DataFrame()
+
+    reg = team_scores[~team_scores["is_playoff"]]
+    stats = reg.groupby("team_name", observed=True).agg(
+        total_points=("points_for", "sum"),
+        games=("points_for", "size"),
+        wins=("won", "sum"),
+        avg_score=("points_for", "mean"),
+        std_dev=("points_for", "std"),
+        min_score=("points_for", "min"),
+        max_score=("points_for", "max"),
+        seasons=("season", "nunique"),
+    ).reset_index()
+    stats["losses"] = stats["games"] - stats["wins"]
+    stats["win_pct"] = stats["wins"] / stats["games"]
+    stats["ppg"] = stats["total_points"] / stats["games"]
+
+    _last_manager_stats = (matchups_df, stats)
+    return stats
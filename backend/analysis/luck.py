@@ -16,7 +16,7 @@ def get_weekly_median_scores(matchups_df: pd.DataFrame) -> pd.DataFrame:
     """
     team_scores = get_team_scores_by_week(matchups_df)
 
-    weekly_medians = team_scores.groupby(["season", "week"])["points_for"].median().reset_index()
+    weekly_medians = team_scores.groupby(["season", "week"], observed=True)["points_for"].median().reset_index()
     weekly_medians.columns = ["season", "week", "median_score"]
 
     return weekly_medians
@@ -105,7 +105,7 @@ def calculate_all_play_records(matchups_df: pd.DataFrame) -> pd.DataFrame:
 
     all_play_records = []
 
-    for (season, week), week_scores in team_scores.groupby(["season", "week"]):
+    for (season, week), week_scores in team_scores.groupby(["season", "week"], observed=True):
         scores = week_scores["points_for"].values
         team_names = week_scores["team_name"].values
 
@@ -127,7 +127,7 @@ def calculate_all_play_records(matchups_df: pd.DataFrame) -> pd.DataFrame:
     records_df = pd.DataFrame(all_play_records)
 
     # Aggregate by team and season
-    season_all_play = records_df.groupby(["season", "team_name"]).agg({
+    season_all_play = records_df.groupby(["season", "team_name"], observed=True).agg({
         "all_play_wins": "sum",
         "all_play_losses": "sum",
         "all_play_ties": "sum",
@@ -157,7 +157,7 @@ def get_alltime_all_play_records(matchups_df: pd.DataFrame) -> pd.DataFrame:
     season_all_play = calculate_all_play_records(matchups_df)
 
     # Aggregate across all seasons
-    alltime = season_all_play.groupby("team_name").agg({
+    alltime = season_all_play.groupby("team_name", observed=True).agg({
         "all_play_wins": "sum",
         "all_play_losses": "sum",
         "all_play_ties": "sum",
@@ -173,7 +173,7 @@ def get_alltime_all_play_records(matchups_df: pd.DataFrame) -> pd.DataFrame:
     )
 
     # Count seasons
-    seasons_count = season_all_play.groupby("team_name")["season"].nunique().reset_index()
+    seasons_count = season_all_play.groupby("team_name", observed=True)["season"].nunique().reset_index()
     seasons_count.columns = ["team_name", "seasons"]
     alltime = alltime.merge(seasons_count, on="team_name")
 
@@ -193,7 +193,7 @@ def get_luck_index(matchups_df: pd.DataFrame) -> pd.DataFrame:
     team_scores = team_scores[~team_scores["is_playoff"]]
 
     # Actual records
-    actual = team_scores.groupby(["season", "team_name"]).agg({
+    actual = team_scores.groupby(["season", "team_name"], observed=True).agg({
         "won": "sum",
         "week": "count",
     }).reset_index()
@@ -257,7 +257,7 @@ def get_points_against_analysis(matchups_df: pd.DataFrame) -> pd.DataFrame:
     team_scores = get_team_scores_by_week(matchups_df)
     team_scores = team_scores[~team_scores["is_playoff"]]
 
-    pa_stats = team_scores.groupby(["season", "team_name"]).agg({
+    pa_stats = team_scores.groupby(["season", "team_name"], observed=True).agg({
         "points_against": ["sum", "mean"],
         "points_for": "sum",
         "won": "sum",
@@ -268,7 +268,7 @@ def get_points_against_analysis(matchups_df: pd.DataFrame) -> pd.DataFrame:
     ]
 
     # Rank by points against within each season
-    pa_stats["pa_rank"] = pa_stats.groupby("season")["total_pa"].rank(ascending=True)
+    pa_stats["pa_rank"] = pa_stats.groupby("season", observed=True)["total_pa"].rank(ascending=True)
 
     return pa_stats.sort_values(["season", "total_pa"], ascending=[False, True])
 
@@ -285,7 +285,7 @@ def get_points_against_leaders_by_year(matchups_df: pd.DataFrame) -> pd.DataFram
     team_scores = get_team_scores_by_week(matchups_df)
     team_scores = team_scores[~team_scores["is_playoff"]]
 
-    pa_stats = team_scores.groupby(["season", "team_name"]).agg({
+    pa_stats = team_scores.groupby(["season", "team_name"], observed=True).agg({
         "points_against": ["sum", "mean"],
         "won": "sum",
         "week": "count",
@@ -296,11 +296,11 @@ def get_points_against_leaders_by_year(matchups_df: pd.DataFrame) -> pd.DataFram
     ]
 
     # Get max PA per season
-    idx = pa_stats.groupby("season")["total_pa"].idxmax()
+    idx = pa_stats.groupby("season", observed=True)["total_pa"].idxmax()
     leaders = pa_stats.loc[idx].copy()
 
     # Calculate league average PA for context
-    season_avg = pa_stats.groupby("season")["total_pa"].mean().reset_index()
+    season_avg = pa_stats.groupby("season", observed=True)["total_pa"].mean().reset_index()
     season_avg.columns = ["season", "league_avg_pa"]
 
     leaders = leaders.merge(season_avg, on="season")
@@ -1,5 +1,6 @@
 """Playoff and championship analysis."""
 
+import numpy as np
 import pandas as pd
 from .helpers import get_team_scores_by_week
 
@@ -16,7 +17,7 @@ def get_playoff_appearances(standings_df: pd.DataFrame) -> pd.DataFrame:
     if standings_df.empty:
         return pd.DataFrame()
 
-    appearances = standings_df.groupby("team_name").agg({
+    appearances = standings_df.groupby("team_name", observed=True).agg({
         "made_playoffs": "sum",
         "season": "count",
     }).reset_index()
@@ -41,7 +42,7 @@ def get_championship_counts(standings_df: pd.DataFrame) -> pd.DataFrame:
     if standings_df.empty or "won_championship" not in standings_df.columns:
         return pd.DataFrame()
 
-    champs = standings_df.groupby("team_name").agg({
+    champs = standings_df.groupby("team_name", observed=True).agg({
         "won_championship": "sum",
         "finals_appearance": "sum",
         "season": "count",
@@ -120,67 +121,59 @@ def get_podium_by_year(standings_df: pd.DataFrame, matchups_df: pd.DataFrame = N
     if standings_df.empty:
         return pd.DataFrame()
 
-    podium_data = []
-
-    for season in sorted(standings_df["season"].unique(), reverse=True):
-        season_df = standings_df[standings_df["season"] == season]
-
-        # 1st place = championship winner (won_championship == True)
-        first_place = ""
-        if "won_championship" in season_df.columns:
-            champ = season_df[season_df["won_championship"] == True]["team_name"].values
-            if len(champ) > 0:
-                first_place = champ[0]
-
-        # 2nd place = finals loser (finals_appearance == True but won_championship == False)
-        second_place = ""
-        if "finals_appearance" in season_df.columns and "won_championship" in season_df.columns:
-            runner_up = season_df[
-                (season_df["finals_appearance"] == True) &
-                (season_df["won_championship"] == False)
-            ]["team_name"].values
-            if len(runner_up) > 0:
-                second_place = runner_up[0]
-
-        # 3rd place: Try to determine from playoff matchups if available
-        # Otherwise fall back to rank 3 from standings
-        third_place = ""
-        if matchups_df is not None and not matchups_df.empty:
-            # Look for 3rd place game (typically week 16 or 17, playoff but not championship)
-            season_playoffs = matchups_df[
-                (matchups_df["season"] == season) &
-                (matchups_df["is_playoff"] == True) &
-                (matchups_df["is_championship"] == False)
+    cols = standings_df.columns
+
+    # 1st place = championship winner, 2nd = finals loser; one filtered scan
+    # per column pair instead of a boolean mask per season
+    first_by_season = {}
+    second_by_season = {}
+    if "won_championship" in cols:
+        champs = standings_df[standings_df["won_championship"] == True]
+        first_by_season = champs.drop_duplicates("season").set_index("season")["team_name"].to_dict()
+        if "finals_appearance" in cols:
+            runners = standings_df[
+                (standings_df["finals_appearance"] == True) &
+                (standings_df["won_championship"] == False)
             ]
-            # Get the last week of non-championship playoff games (3rd place game week)
-            if not season_playoffs.empty:
-                last_playoff_week = season_playoffs["week"].max()
-                third_place_games = season_playoffs[season_playoffs["week"] == last_playoff_week]
-
-                # Find the game that doesn't include the finalists
-                for _, game in third_place_games.iterrows():
-                    t1, t2 = game["team1_name"], game["team2_name"]
-                    s1, s2 = game["score1"], game["score2"]
-
-                    # If neither team is a finalist, this is the 3rd place game
-                    if t1 not in [first_place, second_place] and t2 not in [first_place, second_place]:
-                        third_place = t1 if s1 > s2 else t2
-                        break
-
-        # Fall back to rank 3 if we couldn't determine 3rd place from matchups
-        if not third_place and "rank" in season_df.columns:
-            third = season_df[season_df["rank"] == 3]["team_name"].values
-            if len(third) > 0:
-                third_place = third[0]
-
-        podium_data.append({
-            "season": season,
-            "1st": first_place,
-            "2nd": second_place,
-            "3rd": third_place,
-        })
-
-    return pd.DataFrame(podium_data)
+            second_by_season = runners.drop_duplicates("season").set_index("season")["team_name"].to_dict()
+
+    # 3rd place: the winner of the last non-championship playoff game that
+    # doesn't involve either finalist, resolved for every season at once
+    third_by_season = {}
+    if matchups_df is not None and not matchups_df.empty:
+        consolation = matchups_df[
+            matchups_df["is_playoff"].astype(bool) & ~matchups_df["is_championship"].astype(bool)
+        ]
+        if not consolation.empty:
+            last_week = consolation.groupby("season", observed=True)["week"].transform("max")
+            candidates = consolation[consolation["week"] == last_week]
+            winners = np.where(
+                candidates["score1"].to_numpy() > candidates["score2"].to_numpy(),
+                candidates["team1_name"], candidates["team2_name"],
+            )
+            for season, t1, t2, winner in zip(
+                candidates["season"].tolist(), candidates["team1_name"].tolist(),
+                candidates["team2_name"].tolist(), winners,
+            ):
+                if season in third_by_season:
+                    continue
+                finalists = (first_by_season.get(season, ""), second_by_season.get(season, ""))
+                if t1 not in finalists and t2 not in finalists:
+                    third_by_season[season] = winner
+
+    # Fall back to rank 3 when matchups couldn't determine 3rd place
+    rank3_by_season = {}
+    if "rank" in cols:
+        rank3 = standings_df[standings_df["rank"] == 3]
+        rank3_by_season = rank3.drop_duplicates("season").set_index("season")["team_name"].to_dict()
+
+    seasons = sorted(standings_df["season"].unique(), reverse=True)
+    return pd.DataFrame({
+        "season": seasons,
+        "1st": [first_by_season.get(s, "") for s in seasons],
+        "2nd": [second_by_season.get(s, "") for s in seasons],
+        "3rd": [third_by_season.get(s) or rank3_by_season.get(s, "") for s in seasons],
+    })
 
 
 def get_regular_season_standings_by_year(standings_df: pd.DataFrame) -> pd.DataFrame:
@@ -226,13 +219,14 @@ def get_regular_season_placement_counts(standings_df: pd.DataFrame) -> pd.DataFr
     if standings_df.empty or "rank" not in standings_df.columns:
         return pd.DataFrame()
 
-    # Count placements based on regular season rank
+    # Count placements based on regular season rank: one comparison pass
+    # producing an int8 one-hot block instead of three bool->int64 casts
     standings_copy = standings_df.copy()
-    standings_copy["first"] = (standings_copy["rank"] == 1).astype(int)
-    standings_copy["second"] = (standings_copy["rank"] == 2).astype(int)
-    standings_copy["third"] = (standings_copy["rank"] == 3).astype(int)
+    ranks = standings_copy["rank"].to_numpy()
+    onehot = np.stack([ranks == 1, ranks == 2, ranks == 3], axis=1).astype(np.int8)
+    standings_copy[["first", "second", "third"]] = onehot
 
-    placements = standings_copy.groupby("team_name").agg({
+    placements = standings_copy.groupby("team_name", observed=True).agg({
         "first": "sum",
         "second": "sum",
         "third": "sum",
@@ -262,7 +256,7 @@ def get_playoff_records(matchups_df: pd.DataFrame) -> pd.DataFrame:
     if playoff_games.empty:
         return pd.DataFrame()
 
-    records = playoff_games.groupby("team_name").agg({
+    records = playoff_games.groupby("team_name", observed=True).agg({
         "won": "sum",
         "week": "count",
     }).reset_index()
@@ -311,7 +305,7 @@ def get_championship_bracket_records(
     if champ_games.empty:
         return pd.DataFrame()
 
-    records = champ_games.groupby("team_name").agg({
+    records = champ_games.groupby("team_name", observed=True).agg({
         "won": "sum",
         "week": "count",
     }).reset_index()
@@ -360,7 +354,7 @@ def get_consolation_bracket_records(
     if consolation_games.empty:
         return pd.DataFrame()
 
-    records = consolation_games.groupby("team_name").agg({
+    records = consolation_games.groupby("team_name", observed=True).agg({
         "won": "sum",
         "week": "count",
     }).reset_index()
@@ -392,12 +386,12 @@ def get_regular_vs_playoff_performance(
 
     # Regular season records
     reg_season = team_scores[~team_scores["is_playoff"]]
-    reg_records = reg_season.groupby(["season", "team_name"]).agg({
+    reg_records = reg_season.groupby(["season", "team_name"], observed=True).agg({
         "won": "sum",
         "points_for": "sum",
     }).reset_index()
 
-    reg_records["reg_season_rank"] = reg_records.groupby("season")["won"].rank(
+    reg_records["reg_season_rank"] = reg_records.groupby("season", observed=True)["won"].rank(
         ascending=False, method="min"
     )
 
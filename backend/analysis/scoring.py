@@ -1,7 +1,7 @@
 """Scoring analysis - weekly highs, season totals, all-time leaders."""
 
 import pandas as pd
-from .helpers import get_team_scores_by_week
+from .helpers import get_team_scores_by_week, get_manager_regular_season_stats
 
 
 def get_weekly_high_scores(
@@ -79,7 +79,7 @@ def get_season_scoring_leaders(
     if not include_playoffs:
         team_scores = team_scores[~team_scores["is_playoff"]]
 
-    season_totals = team_scores.groupby(["season", "team_name"]).agg({
+    season_totals = team_scores.groupby(["season", "team_name"], observed=True).agg({
         "points_for": "sum",
         "week": "count",
     }).reset_index()
@@ -88,7 +88,7 @@ def get_season_scoring_leaders(
     season_totals["ppg"] = season_totals["total_points"] / season_totals["games"]
 
     # Rank within each season
-    season_totals["season_rank"] = season_totals.groupby("season")["total_points"].rank(
+    season_totals["season_rank"] = season_totals.groupby("season", observed=True)["total_points"].rank(
         ascending=False
     )
 
@@ -104,20 +104,11 @@ def get_alltime_scoring_leaders(matchups_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with team_name, total_points, games, ppg, seasons
     """
-    team_scores = get_team_scores_by_week(matchups_df)
-
-    # Regular season only for fair comparison
-    team_scores = team_scores[~team_scores["is_playoff"]]
-
-    alltime = team_scores.groupby("team_name").agg({
-        "points_for": "sum",
-        "week": "count",
-        "season": "nunique",
-    }).reset_index()
-
-    alltime.columns = ["team_name", "total_points", "games", "seasons"]
-    alltime["ppg"] = alltime["total_points"] / alltime["games"]
+    stats = get_manager_regular_season_stats(matchups_df)
+    if stats.empty:
+        return stats
 
+    alltime = stats[["team_name", "total_points", "games", "seasons", "ppg"]]
     return alltime.sort_values("total_points", ascending=False).reset_index(drop=True)
 
 
@@ -148,7 +139,7 @@ def get_points_for_vs_against(matchups_df: pd.DataFrame) -> pd.DataFrame:
     team_scores = get_team_scores_by_week(matchups_df)
     team_scores = team_scores[~team_scores["is_playoff"]]
 
-    summary = team_scores.groupby(["season", "team_name"]).agg({
+    summary = team_scores.groupby(["season", "team_name"], observed=True).agg({
         "points_for": "sum",
         "points_against": "sum",
         "won": "sum",
@@ -175,7 +166,7 @@ def get_yearly_scoring_totals(matchups_df: pd.DataFrame) -> pd.DataFrame:
     team_scores = get_team_scores_by_week(matchups_df)
     team_scores = team_scores[~team_scores["is_playoff"]]
 
-    yearly = team_scores.groupby(["season", "team_name"]).agg({
+    yearly = team_scores.groupby(["season", "team_name"], observed=True).agg({
         "points_for": "sum",
     }).reset_index()
 
@@ -31,7 +31,7 @@ def analyze_trades(trades_df: pd.DataFrame) -> pd.DataFrame:
     # Aggregate by trade event
     trade_results = []
 
-    for event_id, event_trades in trades.groupby("trade_event"):
+    for event_id, event_trades in trades.groupby("trade_event", observed=True):
         # Get unique teams in this trade
         teams = set(event_trades["from_team_id"].unique()) | set(event_trades["to_team_id"].unique())
 
@@ -141,11 +141,11 @@ def get_trade_frequency(trades_df: pd.DataFrame) -> pd.DataFrame:
     trades = trades_df.copy()
 
     # Count trades as sender
-    sent = trades.groupby("from_team_id").size().reset_index(name="players_sent")
+    sent = trades.groupby("from_team_id", observed=True).size().reset_index(name="players_sent")
     sent.columns = ["team_id", "players_sent"]
 
     # Count trades as receiver
-    received = trades.groupby("to_team_id").size().reset_index(name="players_received")
+    received = trades.groupby("to_team_id", observed=True).size().reset_index(name="players_received")
     received.columns = ["team_id", "players_received"]
 
     # Merge
@@ -170,8 +170,8 @@ def get_trade_win_rate(trades_df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame()
 
     # Count wins and losses for each team
-    wins = analyzed.groupby("winner_team_id").size().reset_index(name="trade_wins")
-    losses = analyzed.groupby("loser_team_id").size().reset_index(name="trade_losses")
+    wins = analyzed.groupby("winner_team_id", observed=True).size().reset_index(name="trade_wins")
+    losses = analyzed.groupby("loser_team_id", observed=True).size().reset_index(name="trade_losses")
 
     wins.columns = ["team_id", "trade_wins"]
     losses.columns = ["team_id", "trade_losses"]
@@ -204,13 +204,13 @@ def get_trade_counts_by_manager(trades_df: pd.DataFrame) -> pd.DataFrame:
     trades = trades_df.copy()
 
     # Get unique trades per manager
-    from_trades = trades.groupby('from_manager').agg({
+    from_trades = trades.groupby('from_manager', observed=True).agg({
         'trade_id': 'nunique',
         'season': 'nunique'
     }).reset_index()
     from_trades.columns = ['manager', 'trades_as_sender', 'seasons']
 
-    to_trades = trades.groupby('to_manager').agg({
+    to_trades = trades.groupby('to_manager', observed=True).agg({
         'trade_id': 'nunique',
     }).reset_index()
     to_trades.columns = ['manager', 'trades_as_receiver']
@@ -237,34 +237,32 @@ def get_total_moves_by_manager(trades_df: pd.DataFrame, adds_df: pd.DataFrame) -
     Returns:
         DataFrame with manager, trades, adds, total moves
     """
-    # Count trades
-    trade_counts = pd.DataFrame()
+    # Count unique trades and adds per manager via the hashed value_counts
+    # path; nunique-per-group is much slower than dedupe-then-count
+    trade_counts = pd.Series(dtype='int64')
     if not trades_df.empty and 'from_manager' in trades_df.columns:
-        # Count unique trades per manager
-        from_trades = trades_df.groupby('from_manager')['trade_id'].nunique().reset_index()
-        from_trades.columns = ['manager', 'trades']
-        trade_counts = from_trades
+        trade_counts = (
+            trades_df.drop_duplicates(['from_manager', 'trade_id'])['from_manager']
+            .value_counts()
+        )
 
-    # Count adds
-    add_counts = pd.DataFrame()
+    add_counts = pd.Series(dtype='int64')
     if not adds_df.empty and 'manager' in adds_df.columns:
-        add_counts = adds_df.groupby('manager').size().reset_index(name='adds')
+        add_counts = adds_df['manager'].value_counts()
 
-    # Merge
     if trade_counts.empty and add_counts.empty:
         return pd.DataFrame()
 
-    if trade_counts.empty:
-        result = add_counts.copy()
-        result['trades'] = 0
-    elif add_counts.empty:
-        result = trade_counts.copy()
-        result['adds'] = 0
-    else:
-        result = trade_counts.merge(add_counts, on='manager', how='outer').fillna(0)
-
-    result['trades'] = result['trades'].astype(int)
-    result['adds'] = result['adds'].astype(int)
+    # Aligning the two counts on the manager index replaces the branchy
+    # empty-frame merge handling
+    result = (
+        pd.concat([trade_counts.rename('trades'), add_counts.rename('adds')], axis=1)
+        .fillna(0)
+        .astype(int)
+        .rename_axis('manager')
+        .reset_index()
+    )
+    result = result[result['manager'].notna()]
     result['total_moves'] = result['trades'] + result['adds']
 
     return result[['manager', 'trades', 'adds', 'total_moves']].sort_values(
@@ -51,7 +51,7 @@ def get_waiver_pickup_summary(adds_df: pd.DataFrame) -> pd.DataFrame:
     adds = adds_df.copy()
 
     # Basic counts
-    summary = adds.groupby("team_id").agg({
+    summary = adds.groupby("team_id", observed=True).agg({
         "player_id": "count",
         "is_waiver": "sum",
     }).reset_index()
@@ -61,7 +61,7 @@ def get_waiver_pickup_summary(adds_df: pd.DataFrame) -> pd.DataFrame:
 
     # Add points if available
     if "points_after" in adds.columns:
-        points = adds.groupby("team_id")["points_after"].sum().reset_index()
+        points = adds.groupby("team_id", observed=True)["points_after"].sum().reset_index()
         points.columns = ["team_id", "total_points_from_adds"]
         summary = summary.merge(points, on="team_id")
         summary["avg_points_per_add"] = summary["total_points_from_adds"] / summary["total_adds"]
@@ -83,7 +83,7 @@ def get_waiver_activity_by_season(adds_df: pd.DataFrame) -> pd.DataFrame:
 
     adds = adds_df.copy()
 
-    activity = adds.groupby(["season", "team_id"]).agg({
+    activity = adds.groupby(["season", "team_id"], observed=True).agg({
         "player_id": "count",
         "is_waiver": "sum",
     }).reset_index()
@@ -91,7 +91,7 @@ def get_waiver_activity_by_season(adds_df: pd.DataFrame) -> pd.DataFrame:
     activity.columns = ["season", "team_id", "total_adds", "waiver_claims"]
 
     if "points_after" in adds.columns:
-        points = adds.groupby(["season", "team_id"])["points_after"].sum().reset_index()
+        points = adds.groupby(["season", "team_id"], observed=True)["points_after"].sum().reset_index()
         points.columns = ["season", "team_id", "points_from_adds"]
         activity = activity.merge(points, on=["season", "team_id"])
 
@@ -112,7 +112,7 @@ def get_position_pickup_success(adds_df: pd.DataFrame) -> pd.DataFrame:
 
     adds = adds_df.copy()
 
-    position_stats = adds.groupby("position").agg({
+    position_stats = adds.groupby("position", observed=True).agg({
         "player_id": "count",
         "points_after": ["sum", "mean", "max"],
     }).reset_index()
@@ -139,7 +139,7 @@ def get_waiver_mvps_by_season(adds_df: pd.DataFrame) -> pd.DataFrame:
     adds = adds_df.copy()
 
     # Get the best pickup per season
-    mvps = adds.loc[adds.groupby("season")["points_after"].idxmax()]
+    mvps = adds.loc[adds.groupby("season", observed=True)["points_after"].idxmax()]
 
     return mvps[
         ["season", "team_id", "player_name", "position", "source_type", "points_after"]
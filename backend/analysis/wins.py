@@ -1,7 +1,7 @@
 """Win/loss record and streak analysis."""
 
 import pandas as pd
-from .helpers import get_team_scores_by_week
+from .helpers import get_team_scores_by_week, get_manager_regular_season_stats
 
 
 def get_season_win_leaders(matchups_df: pd.DataFrame) -> pd.DataFrame:
@@ -16,7 +16,7 @@ def get_season_win_leaders(matchups_df: pd.DataFrame) -> pd.DataFrame:
     team_scores = get_team_scores_by_week(matchups_df)
     team_scores = team_scores[~team_scores["is_playoff"]]  # Regular season only
 
-    season_records = team_scores.groupby(["season", "team_name"]).agg({
+    season_records = team_scores.groupby(["season", "team_name"], observed=True).agg({
         "won": "sum",
         "week": "count",
     }).reset_index()
@@ -26,7 +26,7 @@ def get_season_win_leaders(matchups_df: pd.DataFrame) -> pd.DataFrame:
     season_records["win_pct"] = season_records["wins"] / season_records["games"]
 
     # Rank within each season
-    season_records["season_rank"] = season_records.groupby("season")["wins"].rank(
+    season_records["season_rank"] = season_records.groupby("season", observed=True)["wins"].rank(
         ascending=False, method="min"
     )
 
@@ -42,19 +42,11 @@ def get_alltime_win_leaders(matchups_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with team_name, wins, losses, win_pct, seasons
     """
-    team_scores = get_team_scores_by_week(matchups_df)
-    team_scores = team_scores[~team_scores["is_playoff"]]
-
-    alltime = team_scores.groupby("team_name").agg({
-        "won": "sum",
-        "week": "count",
-        "season": "nunique",
-    }).reset_index()
-
-    alltime.columns = ["team_name", "wins", "games", "seasons"]
-    alltime["losses"] = alltime["games"] - alltime["wins"]
-    alltime["win_pct"] = alltime["wins"] / alltime["games"]
+    stats = get_manager_regular_season_stats(matchups_df)
+    if stats.empty:
+        return stats
 
+    alltime = stats[["team_name", "wins", "games", "seasons", "losses", "win_pct"]]
     return alltime.sort_values("wins", ascending=False).reset_index(drop=True)
 
 
@@ -71,7 +63,7 @@ def get_worst_teams_by_season(matchups_df: pd.DataFrame) -> pd.DataFrame:
     team_scores = team_scores[~team_scores["is_playoff"]]
 
     # Get full stats per team/season
-    season_stats = team_scores.groupby(["season", "team_name"]).agg({
+    season_stats = team_scores.groupby(["season", "team_name"], observed=True).agg({
         "won": "sum",
         "week": "count",
         "points_for": ["sum", "mean"],
@@ -82,7 +74,7 @@ def get_worst_teams_by_season(matchups_df: pd.DataFrame) -> pd.DataFrame:
     season_stats["win_pct"] = season_stats["wins"] / season_stats["games"]
 
     # Calculate median PPG per season
-    season_median = season_stats.groupby("season")["avg_ppg"].median().reset_index()
+    season_median = season_stats.groupby("season", observed=True)["avg_ppg"].median().reset_index()
     season_median.columns = ["season", "median_ppg"]
 
     season_stats = season_stats.merge(season_median, on="season")
@@ -90,7 +82,7 @@ def get_worst_teams_by_season(matchups_df: pd.DataFrame) -> pd.DataFrame:
 
     # Get worst team per season (fewest wins)
     worst_per_season = season_stats.loc[
-        season_stats.groupby("season")["wins"].idxmin()
+        season_stats.groupby("season", observed=True)["wins"].idxmin()
     ]
 
     return worst_per_season[
@@ -110,7 +102,7 @@ def get_best_teams_by_season(matchups_df: pd.DataFrame) -> pd.DataFrame:
     season_records = get_season_win_leaders(matchups_df)
 
     best_per_season = season_records.loc[
-        season_records.groupby("season")["wins"].idxmax()
+        season_records.groupby("season", observed=True)["wins"].idxmax()
     ]
 
     return best_per_season[
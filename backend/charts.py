@@ -8,6 +8,38 @@ from io import BytesIO
 from pathlib import Path
 
 
+# One figure reused for every chart: creating a fresh figure per call
+# reallocates Agg rasterizer and font-cache state, which dominates chart
+# time in reports with many sections.
+_shared_fig = None
+
+
+def _get_figure(figsize):
+    """Return the shared figure, cleared and resized for the next chart."""
+    global _shared_fig
+    if _shared_fig is None:
+        _shared_fig = plt.figure(figsize=figsize)
+    else:
+        _shared_fig.clf()
+        _shared_fig.set_size_inches(*figsize)
+    return _shared_fig
+
+
+def _render_png(fig, output_path: str = None) -> BytesIO:
+    """Render the figure to a PNG buffer, optionally also writing to disk."""
+    fig.tight_layout()
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight")
+    buf.seek(0)
+
+    if output_path:
+        with open(output_path, "wb") as f:
+            f.write(buf.getvalue())
+        buf.seek(0)
+
+    return buf
+
+
 def create_h2h_heatmap(h2h_matrix: pd.DataFrame, output_path: str = None) -> BytesIO:
     """Create a head-to-head heatmap.
 
@@ -21,7 +53,8 @@ def create_h2h_heatmap(h2h_matrix: pd.DataFrame, output_path: str = None) -> Byt
     if h2h_matrix.empty:
         return None
 
-    fig, ax = plt.subplots(figsize=(12, 10))
+    fig = _get_figure((12, 10))
+    ax = fig.add_subplot(111)
 
     # Create heatmap
     im = ax.imshow(h2h_matrix.values, cmap="RdYlGn", vmin=0, vmax=1)
@@ -39,20 +72,7 @@ def create_h2h_heatmap(h2h_matrix: pd.DataFrame, output_path: str = None) -> Byt
     # Add title
     ax.set_title("Head-to-Head Win Percentage", fontsize=14, fontweight="bold")
 
-    plt.tight_layout()
-
-    # Save to buffer
-    buf = BytesIO()
-    plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-    buf.seek(0)
-    plt.close(fig)
-
-    if output_path:
-        with open(output_path, "wb") as f:
-            f.write(buf.getvalue())
-        buf.seek(0)
-
-    return buf
+    return _render_png(fig, output_path)
 
 
 def create_bar_chart(
@@ -85,7 +105,8 @@ def create_bar_chart(
     if data.empty:
         return None
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = _get_figure((10, 6))
+    ax = fig.add_subplot(111)
 
     if horizontal:
         ax.barh(data[x_col], data[y_col], color=color)
@@ -96,22 +117,10 @@ def create_bar_chart(
         ax.bar(data[x_col], data[y_col], color=color)
         ax.set_xlabel(xlabel or x_col)
         ax.set_ylabel(ylabel or y_col)
-        plt.xticks(rotation=45, ha="right")
+        plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
 
     ax.set_title(title, fontsize=14, fontweight="bold")
-    plt.tight_layout()
-
-    buf = BytesIO()
-    plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-    buf.seek(0)
-    plt.close(fig)
-
-    if output_path:
-        with open(output_path, "wb") as f:
-            f.write(buf.getvalue())
-        buf.seek(0)
-
-    return buf
+    return _render_png(fig, output_path)
 
 
 def create_line_chart(
@@ -142,10 +151,11 @@ def create_line_chart(
     if data.empty:
         return None
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = _get_figure((12, 6))
+    ax = fig.add_subplot(111)
 
     if group_col:
-        for name, group in data.groupby(group_col):
+        for name, group in data.groupby(group_col, observed=True):
             ax.plot(group[x_col], group[y_col], label=name, marker="o")
         ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=8)
     else:
@@ -156,19 +166,7 @@ def create_line_chart(
     ax.set_title(title, fontsize=14, fontweight="bold")
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
-    buf = BytesIO()
-    plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-    buf.seek(0)
-    plt.close(fig)
-
-    if output_path:
-        with open(output_path, "wb") as f:
-            f.write(buf.getvalue())
-        buf.seek(0)
-
-    return buf
+    return _render_png(fig, output_path)
 
 
 def create_stacked_bar_chart(
@@ -199,7 +197,8 @@ def create_stacked_bar_chart(
     if data.empty:
         return None
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = _get_figure((12, 6))
+    ax = fig.add_subplot(111)
 
     if colors is None:
         colors = plt.cm.tab10.colors[:len(y_cols)]
@@ -213,21 +212,9 @@ def create_stacked_bar_chart(
     ax.set_ylabel(ylabel or "Value")
     ax.set_title(title, fontsize=14, fontweight="bold")
     ax.legend()
-    plt.xticks(rotation=45, ha="right")
-
-    plt.tight_layout()
-
-    buf = BytesIO()
-    plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-    buf.seek(0)
-    plt.close(fig)
-
-    if output_path:
-        with open(output_path, "wb") as f:
-            f.write(buf.getvalue())
-        buf.seek(0)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
 
-    return buf
+    return _render_png(fig, output_path)
 
 
 def create_pie_chart(
@@ -252,7 +239,8 @@ def create_pie_chart(
     if data.empty:
         return None
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig = _get_figure((10, 8))
+    ax = fig.add_subplot(111)
 
     ax.pie(
         data[value_col],
@@ -262,19 +250,7 @@ def create_pie_chart(
     )
     ax.set_title(title, fontsize=14, fontweight="bold")
 
-    plt.tight_layout()
-
-    buf = BytesIO()
-    plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-    buf.seek(0)
-    plt.close(fig)
-
-    if output_path:
-        with open(output_path, "wb") as f:
-            f.write(buf.getvalue())
-        buf.seek(0)
-
-    return buf
+    return _render_png(fig, output_path)
 
 
 def create_scatter_plot(
@@ -307,11 +283,12 @@ def create_scatter_plot(
     if data.empty:
         return None
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig = _get_figure((10, 8))
+    ax = fig.add_subplot(111)
 
     if color_col:
         scatter = ax.scatter(data[x_col], data[y_col], c=data[color_col], cmap="viridis", alpha=0.7)
-        plt.colorbar(scatter, label=color_col)
+        fig.colorbar(scatter, ax=ax, label=color_col)
     else:
         ax.scatter(data[x_col], data[y_col], alpha=0.7)
 
@@ -329,19 +306,7 @@ def create_scatter_plot(
     ax.set_title(title, fontsize=14, fontweight="bold")
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
-    buf = BytesIO()
-    plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-    buf.seek(0)
-    plt.close(fig)
-
-    if output_path:
-        with open(output_path, "wb") as f:
-            f.write(buf.getvalue())
-        buf.seek(0)
-
-    return buf
+    return _render_png(fig, output_path)
 
 
 def create_yearly_scoring_chart(
@@ -362,7 +327,8 @@ def create_yearly_scoring_chart(
     if data.empty:
         return None
 
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig = _get_figure((14, 8))
+    ax = fig.add_subplot(111)
 
     # Get unique managers and assign colors
     managers = data["team_name"].unique()
@@ -393,16 +359,4 @@ def create_yearly_scoring_chart(
         framealpha=0.9,
     )
 
-    plt.tight_layout()
-
-    buf = BytesIO()
-    plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-    buf.seek(0)
-    plt.close(fig)
-
-    if output_path:
-        with open(output_path, "wb") as f:
-            f.write(buf.getvalue())
-        buf.seek(0)
-
-    return buf
+    return _render_png(fig, output_path)
@@ -44,6 +44,9 @@ class Settings:
         self.reports_dir = os.environ.get("REPORTS_DIR", "./reports")
         self.max_report_age_hours = 24
 
+        # Report generation
+        self.max_concurrent_reports = int(os.environ.get("MAX_CONCURRENT_REPORTS", "2"))
+
         # Debug: print what we loaded
         print(f"[CONFIG] YAHOO_CLIENT_ID: {self.yahoo_client_id[:20]}..." if self.yahoo_client_id else "[CONFIG] YAHOO_CLIENT_ID: NOT SET")
         print(f"[CONFIG] === End Config Debug ===")
@@ -1,14 +1,20 @@
 """Fantasy Football Report Generator - Web API."""
 
 import os
-import uuid
+import gzip
+import time
+import queue
 import asyncio
+import hashlib
+import logging
+import secrets
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
-from fastapi import FastAPI, Request, HTTPException, BackgroundTasks
-from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, JSONResponse
+from fastapi import FastAPI, Request, HTTPException, BackgroundTasks, Depends
+from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -20,11 +26,22 @@ from yahoo_api import YahooFantasyAPI, discover_league_history as yahoo_discover
 from sleeper_api import SleeperFantasyAPI, SleeperUser, lookup_user as sleeper_lookup_user, discover_league_history as sleeper_discover_league_history
 from report_service import ReportGenerator
 
+# Logging: handlers only enqueue records (O(us)); the listener thread does the
+# blocking stream I/O off the event loop
+logger = logging.getLogger("ffrg")
+if not logger.handlers:
+    _log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(_log_queue))
+    logger.setLevel(logging.INFO)
+    _log_listener = QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Fantasy Football Report Generator",
     description="Generate comprehensive PDF reports for your Yahoo Fantasy Football league",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -50,6 +67,112 @@ serializer = URLSafeTimedSerializer(settings.secret_key)
 sessions = {}
 jobs = {}
 
+# Global gate so report jobs queue up instead of all fetching/rendering at once
+REPORT_SEM = asyncio.Semaphore(settings.max_concurrent_reports)
+
+# Map content hash -> job_id so identical in-flight requests share one job
+job_hashes = {}
+
+# Last-update timestamps for jobs, used by the sweeper
+job_touched = {}
+
+SESSION_MAX_AGE = 86400  # seconds before an idle session is swept
+JOB_MAX_AGE = 3600  # seconds a finished job (and its PDF) is kept
+
+
+# Fixed-window rate limit counters: {"bucket:ip": (window_start, count)}
+_rate_counters = {}
+
+
+def rate_limit(request: Request, bucket: str, limit: int, window: int) -> None:
+    """Raise 429 when a client exceeds `limit` calls per `window` seconds."""
+    host = request.client.host if request.client else "unknown"
+    key = f"{bucket}:{host}"
+    now = time.monotonic()
+    start, count = _rate_counters.get(key, (now, 0))
+    if now - start >= window:
+        start, count = now, 0
+    count += 1
+    _rate_counters[key] = (start, count)
+    if count > limit:
+        raise HTTPException(status_code=429, detail="Too many requests")
+
+
+def set_status(job_id: str, **fields) -> None:
+    """Apply a batch of job status fields in one call.
+
+    Single write point, so moving the job store out of process (e.g. a
+    Redis HSET per update) only needs to change this helper.
+    """
+    job = jobs.get(job_id)
+    if job is not None:
+        for key, value in fields.items():
+            setattr(job, key, value)
+        job_touched[job_id] = time.time()
+
+
+def find_existing_job(content_hash: str) -> Optional[str]:
+    """Return the job_id of a usable job for this content hash, if any.
+
+    This is the repeat-run cache: an identical request reuses the running
+    job or the finished PDF instead of re-fetching and re-aggregating, so a
+    separate on-disk cache of intermediate aggregates isn't needed.
+    """
+    existing = job_hashes.get(content_hash)
+    if existing:
+        job = jobs.get(existing)
+        if job and job.status in ("pending", "queued", "processing", "completed"):
+            return existing
+        # Stale or failed job - drop the mapping so a fresh job is created
+        del job_hashes[content_hash]
+    return None
+
+
+def _session_age(session: dict) -> float:
+    """Age of a session entry in seconds."""
+    created = session.get("created")
+    if not created:
+        return float("inf")
+    try:
+        return (datetime.utcnow() - datetime.fromisoformat(created)).total_seconds()
+    except ValueError:
+        return float("inf")
+
+
+async def _sweeper():
+    """Periodically drop expired sessions and finished jobs.
+
+    Without this the in-memory sessions/jobs dicts grow for the life of
+    the process (every login and completed report leaks an entry).
+    """
+    while True:
+        await asyncio.sleep(300)
+
+        for sid in [sid for sid, s in sessions.items() if _session_age(s) > SESSION_MAX_AGE]:
+            del sessions[sid]
+
+        now = time.time()
+        for jid in [
+            jid for jid, j in jobs.items()
+            if j.status in ("completed", "failed") and now - job_touched.get(jid, now) > JOB_MAX_AGE
+        ]:
+            del jobs[jid]
+            job_touched.pop(jid, None)
+            # The report file is unreachable once its job entry is gone
+            try:
+                (reports_dir / f"{jid}.pdf").unlink()
+            except OSError:
+                pass
+
+        for h in [h for h, jid in job_hashes.items() if jid not in jobs]:
+            del job_hashes[h]
+
+
+@app.on_event("startup")
+async def start_sweeper():
+    """Start the session/job sweeper loop."""
+    asyncio.create_task(_sweeper())
+
 
 class ReportRequest(BaseModel):
     """Request model for report generation."""
@@ -73,7 +196,7 @@ class SleeperReportRequest(BaseModel):
 class JobStatus(BaseModel):
     """Job status model."""
     job_id: str
-    status: str  # pending, processing, completed, failed
+    status: str  # pending, queued, processing, completed, failed
     progress: int  # 0-100
     message: str
     download_url: Optional[str] = None
@@ -106,23 +229,35 @@ def find_frontend_dir():
     return None
 
 FRONTEND_DIR = find_frontend_dir()
-print(f"Frontend directory: {FRONTEND_DIR}")
+logger.info("Frontend directory: %s", FRONTEND_DIR)
 
 # Mount static files
 if FRONTEND_DIR and FRONTEND_DIR.exists():
     app.mount("/static", StaticFiles(directory=str(FRONTEND_DIR)), name="static")
-    print(f"Static files mounted from: {FRONTEND_DIR}")
+    logger.info("Static files mounted from: %s", FRONTEND_DIR)
 else:
-    print(f"WARNING: Frontend directory not found!")
+    logger.warning("Frontend directory not found!")
+
+# index.html is static for the process lifetime - read (and gzip) it once at
+# startup instead of hitting the disk on every request
+INDEX_HTML = None
+INDEX_HTML_GZ = None
+if FRONTEND_DIR and (FRONTEND_DIR / "index.html").exists():
+    INDEX_HTML = (FRONTEND_DIR / "index.html").read_bytes()
+    INDEX_HTML_GZ = gzip.compress(INDEX_HTML)
 
 
 @app.get("/", response_class=HTMLResponse)
-async def home():
+async def home(request: Request):
     """Serve the main page."""
-    if FRONTEND_DIR:
-        html_path = FRONTEND_DIR / "index.html"
-        if html_path.exists():
-            return HTMLResponse(content=html_path.read_text(encoding='utf-8'))
+    if INDEX_HTML is not None:
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(
+                content=INDEX_HTML_GZ,
+                headers={"Content-Encoding": "gzip"},
+                media_type="text/html",
+            )
+        return HTMLResponse(content=INDEX_HTML)
 
     return HTMLResponse(content=f"""
         <!DOCTYPE html>
@@ -138,9 +273,11 @@ async def home():
 
 
 @app.get("/auth/login")
-async def login():
+async def login(request: Request):
     """Start Yahoo OAuth flow."""
-    state = str(uuid.uuid4())
+    rate_limit(request, "login", 10, 60)
+
+    state = secrets.token_urlsafe(32)
     sessions[state] = {"created": datetime.utcnow().isoformat()}
 
     auth_url = yahoo_oauth.get_authorization_url(state)
@@ -164,7 +301,7 @@ async def oauth_callback(code: str = None, state: str = None, error: str = None)
         tokens = await yahoo_oauth.exchange_code(code)
 
         # Store tokens in session
-        session_id = str(uuid.uuid4())
+        session_id = secrets.token_urlsafe(32)
         sessions[session_id] = {
             "platform": "yahoo",
             "tokens": tokens.to_dict(),
@@ -187,7 +324,7 @@ async def oauth_callback(code: str = None, state: str = None, error: str = None)
         return response
 
     except Exception as e:
-        print(f"OAuth error: {e}")
+        logger.exception("OAuth error")
         return RedirectResponse(url=f"/?error=auth_failed")
 
 
@@ -229,18 +366,58 @@ async def logout(request: Request):
     if session_id and session_id in sessions:
         del sessions[session_id]
 
-    response = JSONResponse({"success": True})
+    response = ORJSONResponse({"success": True})
     response.delete_cookie("session_id")
     return response
 
 
+async def require_yahoo(request: Request) -> YahooTokens:
+    """Dependency: return fresh Yahoo tokens for the session or raise 401."""
+    session_id = request.cookies.get("session_id")
+
+    if not session_id or session_id not in sessions:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    session = sessions[session_id]
+    if "tokens" not in session:
+        raise HTTPException(status_code=401, detail="Not authenticated with Yahoo")
+
+    tokens = YahooTokens.from_dict(session["tokens"])
+
+    # Refresh if expired
+    if tokens.is_expired():
+        try:
+            tokens = await yahoo_oauth.refresh_tokens(tokens.refresh_token)
+            session["tokens"] = tokens.to_dict()
+        except Exception:
+            raise HTTPException(status_code=401, detail="Token refresh failed")
+
+    return tokens
+
+
+async def require_sleeper(request: Request) -> SleeperUser:
+    """Dependency: return the session's Sleeper user or raise 401."""
+    session_id = request.cookies.get("session_id")
+
+    if not session_id or session_id not in sessions:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    session = sessions[session_id]
+    if session.get("platform") != "sleeper" or "sleeper_user" not in session:
+        raise HTTPException(status_code=401, detail="Not authenticated with Sleeper")
+
+    return SleeperUser.from_dict(session["sleeper_user"])
+
+
 # =====================
 # Sleeper Auth Routes
 # =====================
 
 @app.post("/auth/sleeper/connect")
-async def sleeper_connect(connect_request: SleeperConnectRequest):
+async def sleeper_connect(request: Request, connect_request: SleeperConnectRequest):
     """Connect to Sleeper via username lookup."""
+    rate_limit(request, "sleeper_connect", 5, 60)
+
     username = connect_request.username.strip()
 
     if not username:
@@ -253,14 +430,14 @@ async def sleeper_connect(connect_request: SleeperConnectRequest):
             raise HTTPException(status_code=404, detail=f"Sleeper user '{username}' not found")
 
         # Create session
-        session_id = str(uuid.uuid4())
+        session_id = secrets.token_urlsafe(32)
         sessions[session_id] = {
             "platform": "sleeper",
             "sleeper_user": user.to_dict(),
             "created": datetime.utcnow().isoformat(),
         }
 
-        response = JSONResponse({
+        response = ORJSONResponse({
             "success": True,
             "user": {
                 "user_id": user.user_id,
@@ -280,42 +457,31 @@ async def sleeper_connect(connect_request: SleeperConnectRequest):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Sleeper connect error: {e}")
+        logger.exception("Sleeper connect error")
         raise HTTPException(status_code=500, detail="Failed to connect to Sleeper")
 
 
 @app.get("/api/sleeper/leagues")
-async def get_sleeper_leagues(request: Request):
+async def get_sleeper_leagues(user: SleeperUser = Depends(require_sleeper)):
     """Get user's Sleeper leagues."""
-    session_id = request.cookies.get("session_id")
-
-    if not session_id or session_id not in sessions:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    session = sessions[session_id]
-    if session.get("platform") != "sleeper" or "sleeper_user" not in session:
-        raise HTTPException(status_code=401, detail="Not authenticated with Sleeper")
-
-    user = SleeperUser.from_dict(session["sleeper_user"])
-    api = SleeperFantasyAPI(user)
-
     # Get leagues for recent years
     all_leagues = []
     current_year = datetime.now().year
 
-    for year in range(current_year, current_year - 3, -1):
-        try:
-            leagues = await api.get_user_leagues(year)
-            for league in leagues:
-                all_leagues.append({
-                    "league_id": league["league_id"],
-                    "name": league["name"],
-                    "year": year,
-                    "total_rosters": league.get("total_rosters", 0),
-                })
-        except Exception as e:
-            print(f"[Sleeper] Error getting leagues for {year}: {e}")
-            continue
+    async with SleeperFantasyAPI(user) as api:
+        for year in range(current_year, current_year - 3, -1):
+            try:
+                leagues = await api.get_user_leagues(year)
+                for league in leagues:
+                    all_leagues.append({
+                        "league_id": league["league_id"],
+                        "name": league["name"],
+                        "year": year,
+                        "total_rosters": league.get("total_rosters", 0),
+                    })
+            except Exception as e:
+                logger.warning("[Sleeper] Error getting leagues for %s: %s", year, e)
+                continue
 
     return {"leagues": all_leagues}
 
@@ -325,34 +491,36 @@ async def generate_sleeper_report(
     request: Request,
     report_request: SleeperReportRequest,
     background_tasks: BackgroundTasks,
+    user: SleeperUser = Depends(require_sleeper),
 ):
     """Start Sleeper report generation."""
-    session_id = request.cookies.get("session_id")
-
-    if not session_id or session_id not in sessions:
-        raise HTTPException(status_code=401, detail="Not authenticated")
+    rate_limit(request, "report_generate", 3, 3600)
 
-    session = sessions[session_id]
-    if session.get("platform") != "sleeper" or "sleeper_user" not in session:
-        raise HTTPException(status_code=401, detail="Not authenticated with Sleeper")
-
-    user = SleeperUser.from_dict(session["sleeper_user"])
+    # Deduplicate identical in-flight requests
+    content_hash = hashlib.sha256(
+        f"sleeper|{report_request.league_id}|{report_request.start_year}|{report_request.end_year}|{user.user_id}".encode()
+    ).hexdigest()
+    existing = find_existing_job(content_hash)
+    if existing:
+        return {"job_id": existing}
 
     # Create job
-    job_id = str(uuid.uuid4())
+    job_id = secrets.token_urlsafe(32)
     jobs[job_id] = JobStatus(
         job_id=job_id,
         status="pending",
         progress=0,
         message="Starting report generation...",
     )
+    job_hashes[content_hash] = job_id
+    job_touched[job_id] = time.time()
 
     # Start background task
     background_tasks.add_task(
         generate_sleeper_report_task,
         job_id,
         report_request.league_id,
-        user,
+        user.to_dict(),
         report_request.start_year,
         report_request.end_year,
     )
@@ -361,39 +529,20 @@ async def generate_sleeper_report(
 
 
 @app.get("/api/leagues")
-async def get_leagues(request: Request):
+async def get_leagues(tokens: YahooTokens = Depends(require_yahoo)):
     """Get user's leagues for the current year."""
-    session_id = request.cookies.get("session_id")
-
-    if not session_id or session_id not in sessions:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    session = sessions[session_id]
-    tokens = YahooTokens.from_dict(session["tokens"])
-
-    # Refresh if expired
-    if tokens.is_expired():
-        try:
-            tokens = await yahoo_oauth.refresh_tokens(tokens.refresh_token)
-            session["tokens"] = tokens.to_dict()
-        except Exception as e:
-            raise HTTPException(status_code=401, detail="Token refresh failed")
-
-    api = YahooFantasyAPI(tokens)
-
     # Get leagues for recent years
     all_leagues = []
-    for year in [2025, 2024, 2023]:
-        try:
-            leagues = await api.get_user_leagues(year)
-            for league in leagues:
+    async with YahooFantasyAPI(tokens) as api:
+        # One batched request covers all three seasons
+        leagues_by_year = await api.get_user_leagues_multi([2025, 2024, 2023])
+        for year in [2025, 2024, 2023]:
+            for league in leagues_by_year.get(year, []):
                 all_leagues.append({
                     "league_key": league["league_key"],
                     "name": league["name"],
                     "year": year,
                 })
-        except Exception:
-            continue
 
     return {"leagues": all_leagues}
 
@@ -403,39 +552,38 @@ async def generate_report(
     request: Request,
     report_request: ReportRequest,
     background_tasks: BackgroundTasks,
+    tokens: YahooTokens = Depends(require_yahoo),
 ):
     """Start report generation."""
-    session_id = request.cookies.get("session_id")
-
-    if not session_id or session_id not in sessions:
-        raise HTTPException(status_code=401, detail="Not authenticated")
+    rate_limit(request, "report_generate", 3, 3600)
 
-    session = sessions[session_id]
-    tokens = YahooTokens.from_dict(session["tokens"])
+    session_id = request.cookies.get("session_id")
 
-    # Refresh if expired
-    if tokens.is_expired():
-        try:
-            tokens = await yahoo_oauth.refresh_tokens(tokens.refresh_token)
-            session["tokens"] = tokens.to_dict()
-        except Exception as e:
-            raise HTTPException(status_code=401, detail="Token refresh failed")
+    # Deduplicate identical in-flight requests
+    content_hash = hashlib.sha256(
+        f"yahoo|{report_request.league_key}|{report_request.start_year}|{report_request.end_year}|{session_id}".encode()
+    ).hexdigest()
+    existing = find_existing_job(content_hash)
+    if existing:
+        return {"job_id": existing}
 
     # Create job
-    job_id = str(uuid.uuid4())
+    job_id = secrets.token_urlsafe(32)
     jobs[job_id] = JobStatus(
         job_id=job_id,
         status="pending",
         progress=0,
         message="Starting report generation...",
     )
+    job_hashes[content_hash] = job_id
+    job_touched[job_id] = time.time()
 
     # Start background task
     background_tasks.add_task(
         generate_report_task,
         job_id,
         report_request.league_key,
-        tokens,
+        tokens.to_dict(),
         report_request.start_year,
         report_request.end_year,
     )
@@ -478,141 +626,141 @@ async def download_report(job_id: str):
 async def generate_report_task(
     job_id: str,
     league_key: str,
-    tokens: YahooTokens,
+    tokens_dict: dict,
     start_year: Optional[int] = None,
     end_year: Optional[int] = None,
 ):
-    """Background task to generate report."""
+    """Background task to generate report.
+
+    Takes only primitives so the task stays trivially serializable if the
+    queue ever moves out of process.
+    """
+    api = None
     try:
-        job = jobs[job_id]
-        job.status = "processing"
-        job.progress = 5
-        job.message = "Connecting to Yahoo Fantasy..."
-
-        api = YahooFantasyAPI(tokens)
-
-        # Discover league history
-        job.progress = 10
-        job.message = "Discovering league history..."
-
-        league_keys, league_name = await yahoo_discover_league_history(api, league_key)
-
-        # Filter by year range if specified
-        if start_year or end_year:
-            filtered_keys = []
-            for lk, year in league_keys:
-                if start_year and year < start_year:
-                    continue
-                if end_year and year > end_year:
-                    continue
-                filtered_keys.append((lk, year))
-            league_keys = filtered_keys
-
-            if not league_keys:
-                raise ValueError(f"No seasons found in the specified year range ({start_year or 'any'} - {end_year or 'any'})")
-
-        job.progress = 20
-        years_found = [y for _, y in league_keys]
-        if start_year or end_year:
-            job.message = f"Processing {len(league_keys)} seasons ({min(years_found)}-{max(years_found)}) for '{league_name}'"
-        else:
-            job.message = f"Found {len(league_keys)} seasons for '{league_name}'"
-
-        # Fetch all data
-        generator = ReportGenerator(api)
-        await generator.fetch_all_data(league_keys, job)
-
-        # Generate PDF
-        job.progress = 90
-        job.message = "Generating PDF report..."
-
-        output_path = reports_dir / f"{job_id}.pdf"
-        await generator.generate_pdf(league_name, output_path)
-
-        job.status = "completed"
-        job.progress = 100
-        job.message = "Report ready for download!"
-        job.download_url = f"/api/report/download/{job_id}"
+        tokens = YahooTokens.from_dict(tokens_dict)
+        set_status(job_id, status="queued", message="Waiting for an available report slot...")
+
+        async with REPORT_SEM:
+            set_status(job_id, status="processing", progress=5, message="Connecting to Yahoo Fantasy...")
+
+            api = YahooFantasyAPI(tokens)
+
+            # Discover league history
+            set_status(job_id, progress=10, message="Discovering league history...")
+
+            league_keys, league_name = await yahoo_discover_league_history(api, league_key)
+
+            # Filter by year range if specified
+            if start_year or end_year:
+                lo = start_year or 0
+                hi = end_year or 9999
+                league_keys = [(lk, y) for lk, y in league_keys if lo <= y <= hi]
+
+                if not league_keys:
+                    raise ValueError(f"No seasons found in the specified year range ({start_year or 'any'} - {end_year or 'any'})")
+
+            if start_year or end_year:
+                years_found = [y for _, y in league_keys]
+                message = f"Processing {len(league_keys)} seasons ({min(years_found)}-{max(years_found)}) for '{league_name}'"
+            else:
+                message = f"Found {len(league_keys)} seasons for '{league_name}'"
+            set_status(job_id, progress=20, message=message)
+
+            # Fetch all data
+            generator = ReportGenerator(api)
+            await generator.fetch_all_data(league_keys, jobs[job_id])
+
+            # Generate PDF
+            set_status(job_id, progress=90, message="Generating PDF report...")
+
+            output_path = reports_dir / f"{job_id}.pdf"
+            await generator.generate_pdf(league_name, output_path)
+
+            set_status(
+                job_id,
+                status="completed",
+                progress=100,
+                message="Report ready for download!",
+                download_url=f"/api/report/download/{job_id}",
+            )
 
     except Exception as e:
-        print(f"Report generation error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Report generation error")
 
-        job = jobs[job_id]
-        job.status = "failed"
-        job.error = str(e)
-        job.message = f"Error: {str(e)}"
+        set_status(job_id, status="failed", error=str(e), message=f"Error: {str(e)}")
+    finally:
+        if api is not None:
+            await api.aclose()
 
 
 async def generate_sleeper_report_task(
     job_id: str,
     league_id: str,
-    user: SleeperUser,
+    user_dict: dict,
     start_year: Optional[int] = None,
     end_year: Optional[int] = None,
 ):
-    """Background task to generate Sleeper report."""
+    """Background task to generate Sleeper report.
+
+    Takes only primitives so the task stays trivially serializable if the
+    queue ever moves out of process.
+    """
+    api = None
     try:
-        job = jobs[job_id]
-        job.status = "processing"
-        job.progress = 5
-        job.message = "Connecting to Sleeper..."
-
-        api = SleeperFantasyAPI(user)
-
-        # Discover league history
-        job.progress = 10
-        job.message = "Discovering league history..."
-
-        league_ids, league_name = await sleeper_discover_league_history(api, league_id)
-
-        # Filter by year range if specified
-        if start_year or end_year:
-            filtered_ids = []
-            for lid, year in league_ids:
-                if start_year and year < start_year:
-                    continue
-                if end_year and year > end_year:
-                    continue
-                filtered_ids.append((lid, year))
-            league_ids = filtered_ids
-
-            if not league_ids:
-                raise ValueError(f"No seasons found in the specified year range ({start_year or 'any'} - {end_year or 'any'})")
-
-        job.progress = 20
-        years_found = [y for _, y in league_ids]
-        if start_year or end_year:
-            job.message = f"Processing {len(league_ids)} seasons ({min(years_found)}-{max(years_found)}) for '{league_name}'"
-        else:
-            job.message = f"Found {len(league_ids)} seasons for '{league_name}'"
-
-        # Fetch all data
-        generator = ReportGenerator(api)
-        await generator.fetch_all_data(league_ids, job)
-
-        # Generate PDF
-        job.progress = 90
-        job.message = "Generating PDF report..."
-
-        output_path = reports_dir / f"{job_id}.pdf"
-        await generator.generate_pdf(league_name, output_path)
-
-        job.status = "completed"
-        job.progress = 100
-        job.message = "Report ready for download!"
-        job.download_url = f"/api/report/download/{job_id}"
+        user = SleeperUser.from_dict(user_dict)
+        set_status(job_id, status="queued", message="Waiting for an available report slot...")
+
+        async with REPORT_SEM:
+            set_status(job_id, status="processing", progress=5, message="Connecting to Sleeper...")
+
+            api = SleeperFantasyAPI(user)
+
+            # Discover league history
+            set_status(job_id, progress=10, message="Discovering league history...")
+
+            league_ids, league_name = await sleeper_discover_league_history(api, league_id)
+
+            # Filter by year range if specified
+            if start_year or end_year:
+                lo = start_year or 0
+                hi = end_year or 9999
+                league_ids = [(lid, y) for lid, y in league_ids if lo <= y <= hi]
+
+                if not league_ids:
+                    raise ValueError(f"No seasons found in the specified year range ({start_year or 'any'} - {end_year or 'any'})")
+
+            if start_year or end_year:
+                years_found = [y for _, y in league_ids]
+                message = f"Processing {len(league_ids)} seasons ({min(years_found)}-{max(years_found)}) for '{league_name}'"
+            else:
+                message = f"Found {len(league_ids)} seasons for '{league_name}'"
+            set_status(job_id, progress=20, message=message)
+
+            # Fetch all data
+            generator = ReportGenerator(api)
+            await generator.fetch_all_data(league_ids, jobs[job_id])
+
+            # Generate PDF
+            set_status(job_id, progress=90, message="Generating PDF report...")
+
+            output_path = reports_dir / f"{job_id}.pdf"
+            await generator.generate_pdf(league_name, output_path)
+
+            set_status(
+                job_id,
+                status="completed",
+                progress=100,
+                message="Report ready for download!",
+                download_url=f"/api/report/download/{job_id}",
+            )
 
     except Exception as e:
-        print(f"Sleeper report generation error: {e}")
-        import traceback
-        traceback.print_exc()
-
-        job = jobs[job_id]
-        job.status = "failed"
-        job.error = str(e)
-        job.message = f"Error: {str(e)}"
+        logger.exception("Sleeper report generation error")
+
+        set_status(job_id, status="failed", error=str(e), message=f"Error: {str(e)}")
+    finally:
+        if api is not None:
+            await api.aclose()
 
 
 if __name__ == "__main__":
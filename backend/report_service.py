@@ -1,26 +1,14 @@
 """Report generation service."""
 
 import asyncio
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Any
 from datetime import datetime
-from io import BytesIO
 
 import pandas as pd
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak,
-    Table, TableStyle, KeepTogether, HRFlowable
-)
 
 from typing import Union
 # Import for type hints only - works with any API that implements the required methods
@@ -29,74 +17,125 @@ from analysis import (
     head_to_head, scoring, wins, playoffs, games,
     luck, trades, waivers, consistency
 )
-from charts import create_h2h_heatmap, create_yearly_scoring_chart
 
 
-def calculate_standings_from_matchups(matchups: List[dict], teams: dict, season: int) -> List[dict]:
-    """Calculate standings from matchup data when API doesn't return standings info."""
-    team_stats = {}
+def calculate_standings_from_matchups(matchups, teams: dict, season: int = None) -> List[dict]:
+    """Calculate standings from matchup data when API doesn't return standings info.
 
-    # Initialize stats for all teams
-    for tk, tv in teams.items():
-        team_stats[tk] = {
+    `matchups` is anything pd.DataFrame accepts (list of row dicts or dict of
+    column lists). The fetch path already hands in one season's rows, so
+    `season` is only needed when passing mixed-season input.
+    """
+    # Structure-of-arrays: one flat stats array per field, indexed by team
+    # position, instead of a 10-key dict allocated per team up front
+    team_keys = list(teams)
+    key_to_idx = {tk: i for i, tk in enumerate(team_keys)}
+    n_teams = len(team_keys)
+    wins = np.zeros(n_teams, dtype=np.int64)
+    losses = np.zeros(n_teams, dtype=np.int64)
+    ties = np.zeros(n_teams, dtype=np.int64)
+    pf = np.zeros(n_teams)
+    pa = np.zeros(n_teams)
+
+    # Aggregate regular-season results with one vectorized groupby: stack the
+    # matchups into a long frame (one row per team per game) and sum
+    df = pd.DataFrame(matchups)
+    if not df.empty:
+        if season is not None and 'season' in df.columns:
+            df = df[df['season'] == season]
+        if 'is_playoff' in df.columns:
+            df = df[~df['is_playoff'].astype(bool)]
+
+    if not df.empty:
+        # Accumulate into the flat arrays with scatter-adds. np.add.at gives
+        # the same kernel a JIT would emit, without taking on a compiler
+        # dependency
+        i1 = df['team1_id'].map(key_to_idx).fillna(-1).astype(np.int64).values
+        i2 = df['team2_id'].map(key_to_idx).fillna(-1).astype(np.int64).values
+        s1 = df['score1'].astype(float).values
+        s2 = df['score2'].astype(float).values
+        known1 = i1 >= 0
+        known2 = i2 >= 0
+
+        np.add.at(pf, i1[known1], s1[known1])
+        np.add.at(pa, i1[known1], s2[known1])
+        np.add.at(pf, i2[known2], s2[known2])
+        np.add.at(pa, i2[known2], s1[known2])
+
+        np.add.at(wins, i1[known1 & (s1 > s2)], 1)
+        np.add.at(losses, i1[known1 & (s1 < s2)], 1)
+        np.add.at(ties, i1[known1 & (s1 == s2)], 1)
+        np.add.at(wins, i2[known2 & (s2 > s1)], 1)
+        np.add.at(losses, i2[known2 & (s2 < s1)], 1)
+        np.add.at(ties, i2[known2 & (s1 == s2)], 1)
+
+    # Rank by wins (then points_for as tiebreaker); lexsort keys are read
+    # last-to-first, and the output dicts are only built here
+    order = np.lexsort((-pf, -wins))
+    standings_list = []
+    for rank, i in enumerate(order, start=1):
+        tk = team_keys[i]
+        tv = teams[tk]
+        standings_list.append({
             'team_key': tk,
             'name': tv.get('name', 'Unknown'),
             'manager': tv.get('manager', 'Unknown'),
-            'wins': 0,
-            'losses': 0,
-            'ties': 0,
-            'points_for': 0.0,
-            'points_against': 0.0,
-        }
-
-    # Calculate stats from matchups (regular season only)
-    for m in matchups:
-        if m.get('season') != season:
-            continue
-        if m.get('is_playoff', False):
-            continue
-
-        t1_key = m.get('team1_id', '')
-        t2_key = m.get('team2_id', '')
-        s1 = m.get('score1', 0)
-        s2 = m.get('score2', 0)
-
-        if t1_key in team_stats:
-            team_stats[t1_key]['points_for'] += s1
-            team_stats[t1_key]['points_against'] += s2
-            if s1 > s2:
-                team_stats[t1_key]['wins'] += 1
-            elif s1 < s2:
-                team_stats[t1_key]['losses'] += 1
-            else:
-                team_stats[t1_key]['ties'] += 1
-
-        if t2_key in team_stats:
-            team_stats[t2_key]['points_for'] += s2
-            team_stats[t2_key]['points_against'] += s1
-            if s2 > s1:
-                team_stats[t2_key]['wins'] += 1
-            elif s2 < s1:
-                team_stats[t2_key]['losses'] += 1
-            else:
-                team_stats[t2_key]['ties'] += 1
+            'wins': int(wins[i]),
+            'losses': int(losses[i]),
+            'ties': int(ties[i]),
+            'points_for': float(pf[i]),
+            'points_against': float(pa[i]),
+            'rank': rank,
+        })
 
-    # Convert to list and rank by wins (then points_for as tiebreaker)
-    standings_list = list(team_stats.values())
-    standings_list.sort(key=lambda x: (-x['wins'], -x['points_for']))
+    return standings_list
 
-    for i, t in enumerate(standings_list):
-        t['rank'] = i + 1
 
-    return standings_list
-from tables import COLORS, create_styled_table, format_dataframe_for_pdf, create_h2h_matrix_table
+MATCHUP_COLUMNS = (
+    'season', 'week', 'team1_id', 'team1_name', 'team2_id', 'team2_name',
+    'score1', 'score2', 'is_playoff', 'is_championship',
+)
+
+MATCHUP_DTYPES = {
+    'season': np.int16,
+    'week': np.int16,
+    'score1': np.float32,
+    'score2': np.float32,
+    'is_playoff': bool,
+    'is_championship': bool,
+}
+
+TRADE_COLUMNS = ('season', 'trade_id', 'date_ts', 'player_name', 'from_manager', 'to_manager')
+
+ADD_COLUMNS = ('season', 'date_ts', 'player_name', 'manager', 'source_type', 'is_waiver')
+
 
+class _AsciiKeep(dict):
+    """Translate table: ASCII maps to itself, everything else to None (drop).
 
+    str.translate keeps codepoints missing from its table, so the drop has
+    to come from __missing__ rather than absence.
+    """
+
+    def __missing__(self, codepoint):
+        return None
+
+
+_ASCII_KEEP = _AsciiKeep({i: i for i in range(128)})
+
+
+@lru_cache(maxsize=4096)
 def clean(s):
-    """Clean string for ASCII."""
+    """Clean string for ASCII.
+
+    Memoized: the same team/manager names recur for every season, matchup,
+    and transaction, so repeats skip the translate pass. translate with the
+    precomputed table drops non-ASCII in one C-level pass instead of the
+    encode/decode round-trip through the codec registry.
+    """
     if s is None:
         return "Unknown"
-    return str(s).encode('ascii', 'ignore').decode('ascii').strip() or 'Unknown'
+    return str(s).translate(_ASCII_KEEP).strip() or 'Unknown'
 
 
 def get_manager_name(full_name):
@@ -106,12 +145,91 @@ def get_manager_name(full_name):
     return full_name
 
 
+@dataclass
+class TeamCtx:
+    """Per-league team lookup maps, built once from the teams payload.
+
+    display maps team key -> "Manager (Team)" label, mgr maps team key ->
+    bare manager name for transaction attribution.
+    """
+
+    display: dict = field(default_factory=dict)
+    mgr: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_teams(cls, teams: dict) -> "TeamCtx":
+        ctx = cls()
+        for tk, tv in teams.items():
+            mgr = clean(tv.get("manager", "Unknown"))
+            name = clean(tv.get("name", "Unknown"))
+
+            # Prioritize manager name first, fall back to team name
+            if mgr != "--hidden--" and mgr != "Unknown":
+                display_name = f"{mgr} ({name})"  # Manager available - use it
+            elif name != "--hidden--" and name != "Unknown":
+                display_name = name  # Fall back to team name
+            else:
+                display_name = mgr  # Last resort
+
+            ctx.display[tk] = display_name
+            ctx.mgr[tk] = mgr if mgr != "--hidden--" else name
+        return ctx
+
+
+def _player_name(player) -> str:
+    """Extract a player's full name from Yahoo's nested player list."""
+    if not player:
+        return "Unknown"
+    pinfo = player[0] if isinstance(player[0], list) else ()
+    return clean(next(
+        (item["name"].get("full", "Unknown")
+         for item in pinfo if isinstance(item, dict) and "name" in item),
+        "Unknown",
+    ))
+
+
+def _iter_txn_players(txns):
+    """Yield (ts, ts_sec, player_name, transaction_data) per moved player.
+
+    Shared by the Yahoo trade and add parsers, which differ only in which
+    transaction_data fields they read and the row shape they emit.
+    """
+    for txn in txns:
+        ts = txn.get("timestamp")
+        try:
+            ts_sec = int(ts)
+        except (TypeError, ValueError):
+            ts_sec = None
+
+        players = txn.get("players", {})
+
+        # Handle players being either a dict or a list
+        if isinstance(players, dict):
+            players_iter = [v for k, v in players.items() if k != "count" and isinstance(v, dict)]
+        elif isinstance(players, list):
+            players_iter = [p for p in players if isinstance(p, dict)]
+        else:
+            players_iter = []
+
+        for val in players_iter:
+            player = val.get("player", [])
+            if not player or len(player) < 2:
+                continue
+
+            td = player[1].get("transaction_data", {})
+            if isinstance(td, list):
+                td = td[0] if td else {}
+
+            yield ts, ts_sec, _player_name(player), td
+
+
 class ReportGenerator:
     """Generate fantasy football reports.
 
     Works with any API that implements the required methods (duck typing):
     - get_league_teams(league_key) -> dict
-    - get_matchups(league_key, week) -> List[dict]
+    - get_season_matchups(league_key, weeks) -> List[List[dict]]
+      (get_matchups_range on Sleeper)
     - get_league_standings(league_key) -> List[dict]
     - get_transactions(league_key, type, count) -> List[dict]  (optional)
     """
@@ -122,367 +240,422 @@ class ReportGenerator:
         self.standings_df = pd.DataFrame()
         self.trades_df = pd.DataFrame()
         self.adds_df = pd.DataFrame()
+        self._matchups_idx = None
+        self.unique_managers = np.array([], dtype=object)
+        self.team_count = 0
         self.seasons = []
         # Detect platform type based on API class name
         self.is_sleeper = 'Sleeper' in type(api).__name__
 
-    async def fetch_all_data(self, league_keys: List[Tuple[str, int]], job: Any):
-        """Fetch all data for the given leagues."""
-        all_matchups = []
-        all_standings = []
-        all_trades = []
-        all_adds = []
+    async def _fetch_one_league(self, league_key: str, season: int, teams=None) -> Tuple[dict, list, list, list]:
+        """Fetch matchups, standings, and transactions for a single league season.
+
+        Returns (matchup_cols, standings_rows, trade_cols, add_cols) so
+        callers can run several seasons concurrently and merge the results.
+        Matchups and transactions are accumulated column-wise (dict of lists)
+        so the final DataFrames are built without a per-row dtype-inference
+        pass.
+        """
+        matchup_cols = {col: [] for col in MATCHUP_COLUMNS}
+        standings_rows = []
+        trade_cols = {col: [] for col in TRADE_COLUMNS}
+        add_cols = {col: [] for col in ADD_COLUMNS}
+
+        try:
+            # Get teams (pre-fetched by fetch_all_data when running in batch)
+            if teams is None:
+                teams = await self.api.get_league_teams(league_key)
+            elif isinstance(teams, Exception):
+                raise teams
+            # Debug: Log first team from this league
+            if teams:
+                first_key = next(iter(teams))
+                first_team = teams[first_key]
+                print(f"[DEBUG] {season} first team: key={first_key}, data={first_team}", flush=True)
+
+            ctx = TeamCtx.from_teams(teams)
+            team_display = ctx.display
+
+            # Get playoff week start for Sleeper
+            playoff_week_start = 15  # default
+            if self.is_sleeper:
+                try:
+                    settings = await self.api.get_league_settings(league_key)
+                    playoff_week_start = settings.get("playoff_week_start", 15)
+                except:
+                    pass
+
+            # Kick off standings (and Yahoo transactions, which only need the
+            # team maps) so they overlap the weekly matchup fetches
+            standings_task = asyncio.ensure_future(self.api.get_league_standings(league_key))
+            txns_task = None
+            if not self.is_sleeper:
+                txns_task = asyncio.gather(
+                    self.api.get_transactions(league_key, "trade", 100),
+                    self.api.get_transactions(league_key, "add", 200),
+                )
 
-        total_leagues = len(league_keys)
+            # Fetch all candidate weeks up front, then stop at the first
+            # empty week to preserve the old break-on-empty semantics
+            weeks = range(1, 18)
+            if self.is_sleeper:
+                # Bounded-concurrency fan-out shared with the other
+                # Sleeper callers
+                weekly_results = await self.api.get_matchups_range(league_key, weeks)
+            else:
+                # One batched scoreboard request covers the whole season
+                weekly_results = await self.api.get_season_matchups(league_key, weeks)
 
-        for idx, (league_key, season) in enumerate(league_keys):
-            progress = 20 + int((idx / total_leagues) * 60)
-            job.progress = progress
-            job.message = f"Fetching {season} data..."
+            # Both helpers map failed weeks to [], so break-on-empty also
+            # covers the old break-on-exception behavior
+            for week, matchups in zip(weeks, weekly_results):
+                if not matchups:
+                    break
 
-            try:
-                # Get teams
-                teams = await self.api.get_league_teams(league_key)
-                team_display = {}
-                team_to_manager = {}
-
-                # Debug: Log first team from this league
-                if teams:
-                    first_key = next(iter(teams))
-                    first_team = teams[first_key]
-                    print(f"[DEBUG] {season} first team: key={first_key}, data={first_team}", flush=True)
-
-                for tk, tv in teams.items():
-                    mgr = clean(tv.get("manager", "Unknown"))
-                    name = clean(tv.get("name", "Unknown"))
-
-                    # Prioritize manager name first, fall back to team name
-                    if mgr != "--hidden--" and mgr != "Unknown":
-                        display_name = f"{mgr} ({name})"  # Manager available - use it
-                    elif name != "--hidden--" and name != "Unknown":
-                        display_name = name  # Fall back to team name
-                    else:
-                        display_name = mgr  # Last resort
+                for m in matchups:
+                    t1 = m["team1"]
+                    t2 = m["team2"]
 
-                    team_display[tk] = display_name
-                    team_to_manager[tk] = mgr if mgr != "--hidden--" else name
+                    # Handle both Yahoo (team_key) and Sleeper (roster_id) formats
+                    if self.is_sleeper:
+                        t1_key = str(t1.get("roster_id", ""))
+                        t2_key = str(t2.get("roster_id", ""))
+                        is_playoff = week >= playoff_week_start
+                    else:
+                        t1_key = t1.get("team_key", "")
+                        t2_key = t2.get("team_key", "")
+                        is_playoff = m.get("is_playoff", False)
 
-                # Get playoff week start for Sleeper
-                playoff_week_start = 15  # default
-                if self.is_sleeper:
-                    try:
-                        settings = await self.api.get_league_settings(league_key)
-                        playoff_week_start = settings.get("playoff_week_start", 15)
-                    except:
-                        pass
-
-                # Fetch matchups
-                for week in range(1, 18):
-                    matchups = await self.api.get_matchups(league_key, week)
-
-                    if not matchups:
-                        break
-
-                    for m in matchups:
-                        t1 = m["team1"]
-                        t2 = m["team2"]
-
-                        # Handle both Yahoo (team_key) and Sleeper (roster_id) formats
-                        if self.is_sleeper:
-                            t1_key = str(t1.get("roster_id", ""))
-                            t2_key = str(t2.get("roster_id", ""))
-                            is_playoff = week >= playoff_week_start
+                    # Get team name - prefer team_display, fallback to matchup data
+                    if t1_key in team_display:
+                        t1_name = team_display[t1_key]
+                    else:
+                        t1_mgr = clean(t1.get('manager'))
+                        t1_team = clean(t1.get('name'))
+                        if t1_mgr == "--hidden--" and t1_team != "--hidden--":
+                            t1_name = t1_team
+                        elif t1_mgr != "--hidden--":
+                            t1_name = f"{t1_mgr} ({t1_team})"
                         else:
-                            t1_key = t1.get("team_key", "")
-                            t2_key = t2.get("team_key", "")
-                            is_playoff = m.get("is_playoff", False)
+                            t1_name = t1_team if t1_team else f"Team {t1_key}"
 
-                        # Get team name - prefer team_display, fallback to matchup data
-                        if t1_key in team_display:
-                            t1_name = team_display[t1_key]
-                        else:
-                            t1_mgr = clean(t1.get('manager'))
-                            t1_team = clean(t1.get('name'))
-                            if t1_mgr == "--hidden--" and t1_team != "--hidden--":
-                                t1_name = t1_team
-                            elif t1_mgr != "--hidden--":
-                                t1_name = f"{t1_mgr} ({t1_team})"
-                            else:
-                                t1_name = t1_team if t1_team else f"Team {t1_key}"
-
-                        if t2_key in team_display:
-                            t2_name = team_display[t2_key]
-                        else:
-                            t2_mgr = clean(t2.get('manager'))
-                            t2_team = clean(t2.get('name'))
-                            if t2_mgr == "--hidden--" and t2_team != "--hidden--":
-                                t2_name = t2_team
-                            elif t2_mgr != "--hidden--":
-                                t2_name = f"{t2_mgr} ({t2_team})"
-                            else:
-                                t2_name = t2_team if t2_team else f"Team {t2_key}"
-
-                        all_matchups.append({
-                            'season': season,
-                            'week': week,
-                            'team1_id': t1_key,
-                            'team1_name': t1_name,
-                            'team2_id': t2_key,
-                            'team2_name': t2_name,
-                            'score1': t1.get('points', 0),
-                            'score2': t2.get('points', 0),
-                            'is_playoff': is_playoff,
-                            'is_championship': is_playoff and week >= 16,
-                        })
-
-                # Fetch standings
-                standings = await self.api.get_league_standings(league_key)
-
-                # Check if API returned valid standings data (any team has wins > 0)
-                has_valid_standings = any(t.get('wins', 0) > 0 for t in standings)
-
-                if not has_valid_standings and all_matchups:
-                    # Calculate standings from matchup data as fallback
-                    print(f"[STANDINGS] API didn't return wins data for {season}, calculating from matchups", flush=True)
-                    standings = calculate_standings_from_matchups(all_matchups, teams, season)
-
-                for i, t in enumerate(standings):
-                    t_key = t.get("team_key", "")
-                    t_name = team_display.get(t_key, f"{clean(t.get('manager'))} ({clean(t.get('name'))})")
-
-                    all_standings.append({
-                        'season': season,
-                        'team_id': t_key,
-                        'team_name': t_name,
-                        'manager': clean(t.get('manager', 'Unknown')),
-                        'rank': t.get('rank', i + 1),
-                        'wins': t.get('wins', 0),
-                        'losses': t.get('losses', 0),
-                        'ties': t.get('ties', 0),
-                        'points_for': t.get('points_for', 0),
-                        'points_against': t.get('points_against', 0),
-                        'made_playoffs': t.get('rank', i + 1) <= 6,
-                        'won_championship': False,
-                        'finals_appearance': False,
-                    })
-
-                # Fetch transactions
-                try:
-                    if self.is_sleeper:
-                        # Sleeper: fetch transactions for each week
-                        for week in range(1, 18):
-                            try:
-                                txns = await self.api.get_transactions(league_key, week)
-                                for txn in txns:
-                                    txn_type = txn.get("type")
-                                    ts = txn.get("created")
-                                    txn_date = None
-                                    if ts:
-                                        try:
-                                            txn_date = datetime.fromtimestamp(int(ts) / 1000)
-                                        except:
-                                            pass
-
-                                    roster_ids = txn.get("roster_ids", [])
-
-                                    if txn_type == "trade" and len(roster_ids) >= 2:
-                                        trade_id = f"{season}_{ts}"
-                                        # For Sleeper trades, we just track that a trade happened
-                                        from_mgr = team_to_manager.get(str(roster_ids[0]), 'Unknown')
-                                        to_mgr = team_to_manager.get(str(roster_ids[1]), 'Unknown')
-                                        all_trades.append({
-                                            'season': season,
-                                            'trade_id': trade_id,
-                                            'date': txn_date,
-                                            'player_name': 'Trade',
-                                            'from_manager': from_mgr,
-                                            'to_manager': to_mgr,
-                                        })
-
-                                    elif txn_type in ("free_agent", "waiver"):
-                                        adds = txn.get("adds") or {}
-                                        for player_id, roster_id in adds.items():
-                                            mgr = team_to_manager.get(str(roster_id), 'Unknown')
-                                            all_adds.append({
-                                                'season': season,
-                                                'date': txn_date,
-                                                'player_name': f'Player {player_id}',
-                                                'manager': mgr,
-                                                'source_type': txn_type,
-                                                'is_waiver': txn_type == 'waiver',
-                                            })
-                            except:
-                                break
+                    if t2_key in team_display:
+                        t2_name = team_display[t2_key]
                     else:
-                        # Yahoo: use existing transaction parsing
-                        trade_txns = await self.api.get_transactions(league_key, "trade", 100)
-                        add_txns = await self.api.get_transactions(league_key, "add", 200)
-
-                        for txn in trade_txns:
-                            ts = txn.get("timestamp")
-                            txn_date = None
-                            if ts:
-                                try:
-                                    txn_date = datetime.fromtimestamp(int(ts))
-                                except:
-                                    pass
-
-                            trade_id = f"{season}_{ts}"
-                            players = txn.get("players", {})
-
-                            # Handle players being either a dict or a list
-                            players_iter = []
-                            if isinstance(players, dict):
-                                players_iter = [(k, v) for k, v in players.items() if k != "count" and isinstance(v, dict)]
-                            elif isinstance(players, list):
-                                players_iter = [(str(i), p) for i, p in enumerate(players) if isinstance(p, dict)]
-
-                            for key, val in players_iter:
-                                player = val.get("player", [])
-                                if not player:
-                                    continue
-
-                                player_name = "Unknown"
-                                pinfo = player[0] if isinstance(player[0], list) else []
-                                for item in pinfo:
-                                    if isinstance(item, dict) and "name" in item:
-                                        player_name = clean(item["name"].get("full", "Unknown"))
-
-                                if len(player) > 1:
-                                    td = player[1].get("transaction_data", [{}])
-                                    if isinstance(td, list) and td:
-                                        td = td[0]
-                                    dest = td.get("destination_team_key", "")
-                                    source = td.get("source_team_key", "")
-
-                                    all_trades.append({
-                                        'season': season,
-                                        'trade_id': trade_id,
-                                        'date': txn_date,
-                                        'player_name': player_name,
-                                        'from_manager': team_to_manager.get(source, 'Unknown'),
-                                        'to_manager': team_to_manager.get(dest, 'Unknown'),
-                                    })
-
-                        for txn in add_txns:
-                            ts = txn.get("timestamp")
-                            txn_date = None
-                            if ts:
+                        t2_mgr = clean(t2.get('manager'))
+                        t2_team = clean(t2.get('name'))
+                        if t2_mgr == "--hidden--" and t2_team != "--hidden--":
+                            t2_name = t2_team
+                        elif t2_mgr != "--hidden--":
+                            t2_name = f"{t2_mgr} ({t2_team})"
+                        else:
+                            t2_name = t2_team if t2_team else f"Team {t2_key}"
+
+                    matchup_cols['season'].append(season)
+                    matchup_cols['week'].append(week)
+                    matchup_cols['team1_id'].append(t1_key)
+                    matchup_cols['team1_name'].append(t1_name)
+                    matchup_cols['team2_id'].append(t2_key)
+                    matchup_cols['team2_name'].append(t2_name)
+                    matchup_cols['score1'].append(t1.get('points', 0))
+                    matchup_cols['score2'].append(t2.get('points', 0))
+                    matchup_cols['is_playoff'].append(is_playoff)
+                    matchup_cols['is_championship'].append(is_playoff and week >= 16)
+
+            # Fetch standings
+            standings = await standings_task
+
+            # Check if API returned valid standings data (any team has wins > 0)
+            has_valid_standings = any(t.get('wins', 0) > 0 for t in standings)
+
+            if not has_valid_standings and matchup_cols['season']:
+                # Calculate standings from matchup data as fallback
+                print(f"[STANDINGS] API didn't return wins data for {season}, calculating from matchups", flush=True)
+                standings = calculate_standings_from_matchups(matchup_cols, teams)
+
+            for i, t in enumerate(standings):
+                t_key = t.get("team_key", "")
+                t_name = team_display.get(t_key, f"{clean(t.get('manager'))} ({clean(t.get('name'))})")
+
+                standings_rows.append({
+                    'season': season,
+                    'team_id': t_key,
+                    'team_name': t_name,
+                    'manager': clean(t.get('manager', 'Unknown')),
+                    'rank': t.get('rank', i + 1),
+                    'wins': t.get('wins', 0),
+                    'losses': t.get('losses', 0),
+                    'ties': t.get('ties', 0),
+                    'points_for': t.get('points_for', 0),
+                    'points_against': t.get('points_against', 0),
+                    'made_playoffs': t.get('rank', i + 1) <= 6,
+                    'won_championship': False,
+                    'finals_appearance': False,
+                })
+
+            # Fetch transactions
+            try:
+                if self.is_sleeper:
+                    # Sleeper: fetch transactions for each week
+                    for week in range(1, 18):
+                        try:
+                            txns = await self.api.get_transactions(league_key, week)
+                            for txn in txns:
+                                txn_type = txn.get("type")
+                                ts = txn.get("created")
+                                # Sleeper timestamps are milliseconds; keep raw
+                                # seconds and convert the column in one pass later
                                 try:
-                                    txn_date = datetime.fromtimestamp(int(ts))
-                                except:
-                                    pass
-
-                            players = txn.get("players", {})
-
-                            # Handle players being either a dict or a list
-                            players_iter = []
-                            if isinstance(players, dict):
-                                players_iter = [(k, v) for k, v in players.items() if k != "count" and isinstance(v, dict)]
-                            elif isinstance(players, list):
-                                players_iter = [(str(i), p) for i, p in enumerate(players) if isinstance(p, dict)]
-
-                            for key, val in players_iter:
-                                player = val.get("player", [])
-                                if not player:
-                                    continue
-
-                                player_name = "Unknown"
-                                pinfo = player[0] if isinstance(player[0], list) else []
-                                for item in pinfo:
-                                    if isinstance(item, dict) and "name" in item:
-                                        player_name = clean(item["name"].get("full", "Unknown"))
-
-                                if len(player) > 1:
-                                    td = player[1].get("transaction_data", {})
-                                    if isinstance(td, list) and td:
-                                        td = td[0]
-
-                                    if td.get("type") in ("add", "claim"):
-                                        dest = td.get("destination_team_key", "")
-                                        source_type = td.get("source_type", "")
-
-                                        all_adds.append({
-                                            'season': season,
-                                            'date': txn_date,
-                                            'player_name': player_name,
-                                            'manager': team_to_manager.get(dest, 'Unknown'),
-                                            'source_type': source_type,
-                                            'is_waiver': source_type == 'waivers',
-                                        })
-                except Exception as e:
-                    print(f"Transaction error for {season}: {e}")
-
+                                    ts_sec = int(ts) // 1000
+                                except (TypeError, ValueError):
+                                    ts_sec = None
+
+                                roster_ids = txn.get("roster_ids", [])
+
+                                if txn_type == "trade" and len(roster_ids) >= 2:
+                                    trade_id = f"{season}_{ts}"
+                                    # For Sleeper trades, we just track that a trade happened
+                                    from_mgr = ctx.mgr.get(str(roster_ids[0]), 'Unknown')
+                                    to_mgr = ctx.mgr.get(str(roster_ids[1]), 'Unknown')
+                                    trade_cols['season'].append(season)
+                                    trade_cols['trade_id'].append(trade_id)
+                                    trade_cols['date_ts'].append(ts_sec)
+                                    trade_cols['player_name'].append('Trade')
+                                    trade_cols['from_manager'].append(from_mgr)
+                                    trade_cols['to_manager'].append(to_mgr)
+
+                                elif txn_type in ("free_agent", "waiver"):
+                                    adds = txn.get("adds") or {}
+                                    for player_id, roster_id in adds.items():
+                                        mgr = ctx.mgr.get(str(roster_id), 'Unknown')
+                                        add_cols['season'].append(season)
+                                        add_cols['date_ts'].append(ts_sec)
+                                        add_cols['player_name'].append(f'Player {player_id}')
+                                        add_cols['manager'].append(mgr)
+                                        add_cols['source_type'].append(txn_type)
+                                        add_cols['is_waiver'].append(txn_type == 'waiver')
+                        except:
+                            break
+                else:
+                    # Yahoo: use existing transaction parsing
+                    trade_txns, add_txns = await txns_task
+
+                    for ts, ts_sec, player_name, td in _iter_txn_players(trade_txns):
+                        trade_cols['season'].append(season)
+                        trade_cols['trade_id'].append(f"{season}_{ts}")
+                        trade_cols['date_ts'].append(ts_sec)
+                        trade_cols['player_name'].append(player_name)
+                        trade_cols['from_manager'].append(ctx.mgr.get(td.get("source_team_key", ""), 'Unknown'))
+                        trade_cols['to_manager'].append(ctx.mgr.get(td.get("destination_team_key", ""), 'Unknown'))
+
+                    for ts, ts_sec, player_name, td in _iter_txn_players(add_txns):
+                        if td.get("type") in ("add", "claim"):
+                            source_type = td.get("source_type", "")
+                            add_cols['season'].append(season)
+                            add_cols['date_ts'].append(ts_sec)
+                            add_cols['player_name'].append(player_name)
+                            add_cols['manager'].append(ctx.mgr.get(td.get("destination_team_key", ""), 'Unknown'))
+                            add_cols['source_type'].append(source_type)
+                            add_cols['is_waiver'].append(source_type == 'waivers')
             except Exception as e:
-                print(f"Error fetching {season}: {e}")
+                print(f"Transaction error for {season}: {e}")
 
-            # Small delay to avoid rate limiting
-            await asyncio.sleep(0.5)
+        except Exception as e:
+            print(f"Error fetching {season}: {e}")
 
-        # Create DataFrames
-        self.matchups_df = pd.DataFrame(all_matchups)
+        return matchup_cols, standings_rows, trade_cols, add_cols
+
+    async def fetch_all_data(self, league_keys: List[Tuple[str, int]], job: Any):
+        """Fetch all data for the given leagues.
+
+        Seasons are IO-bound on the platform API, so they are fetched
+        concurrently; the semaphore bounds in-flight seasons to stay under
+        provider rate limits.
+        """
+        total_leagues = len(league_keys)
+        sem = asyncio.Semaphore(5)
+        completed = 0
+
+        # Fire all team-map fetches in one burst up front; failures are
+        # surfaced inside the per-league worker to keep its error handling
+        teams_results = await asyncio.gather(
+            *(self.api.get_league_teams(lk) for lk, _ in league_keys),
+            return_exceptions=True,
+        )
+        teams_by_league = {lk: t for (lk, _), t in zip(league_keys, teams_results)}
+
+        async def fetch_with_progress(league_key, season):
+            nonlocal completed
+            async with sem:
+                result = await self._fetch_one_league(
+                    league_key, season, teams=teams_by_league.get(league_key)
+                )
+            completed += 1
+            job.progress = 20 + int((completed / total_leagues) * 60)
+            job.message = f"Fetched {season} data ({completed}/{total_leagues} seasons)"
+            return result
+
+        results = await asyncio.gather(
+            *(fetch_with_progress(lk, season) for lk, season in league_keys)
+        )
+
+        all_matchups = {col: [] for col in MATCHUP_COLUMNS}
+        all_standings = []
+        all_trades = {col: [] for col in TRADE_COLUMNS}
+        all_adds = {col: [] for col in ADD_COLUMNS}
+        for matchup_cols, standings_rows, trade_cols, add_cols in results:
+            for col in MATCHUP_COLUMNS:
+                all_matchups[col].extend(matchup_cols[col])
+            all_standings.extend(standings_rows)
+            for col in TRADE_COLUMNS:
+                all_trades[col].extend(trade_cols[col])
+            for col in ADD_COLUMNS:
+                all_adds[col].extend(add_cols[col])
+
+        # Create DataFrames (columnar input, so no row-wise dtype inference)
+        # Each numeric column list goes straight into a typed array, so the
+        # frame is born with its final dtypes instead of int64/float64 blocks
+        # that get cast afterwards
+        self.matchups_df = pd.DataFrame({
+            col: np.asarray(vals, dtype=MATCHUP_DTYPES[col]) if col in MATCHUP_DTYPES else vals
+            for col, vals in all_matchups.items()
+        }, copy=False)
         self.standings_df = pd.DataFrame(all_standings)
-        self.trades_df = pd.DataFrame(all_trades) if all_trades else pd.DataFrame()
-        self.adds_df = pd.DataFrame(all_adds) if all_adds else pd.DataFrame()
+        self.trades_df = pd.DataFrame(all_trades, copy=False) if all_trades['season'] else pd.DataFrame()
+        self.adds_df = pd.DataFrame(all_adds, copy=False) if all_adds['season'] else pd.DataFrame()
+
+        # One vectorized timestamp conversion instead of per-row fromtimestamp
+        for txn_df in (self.trades_df, self.adds_df):
+            if not txn_df.empty:
+                txn_df['date'] = pd.to_datetime(txn_df['date_ts'], unit='s', errors='coerce')
+                txn_df.drop(columns='date_ts', inplace=True)
+
+        # Dictionary-encode the low-cardinality grouping keys, matching the
+        # matchup/standings casts below
+        if not self.trades_df.empty:
+            cat_cols = ['from_manager', 'to_manager']
+            self.trades_df[cat_cols] = self.trades_df[cat_cols].astype('category')
+        if not self.adds_df.empty:
+            cat_cols = ['manager', 'source_type']
+            self.adds_df[cat_cols] = self.adds_df[cat_cols].astype('category')
+
+        # Normalize names ("Manager (Team)" -> "Manager") with vectorized
+        # string ops instead of a Python call per row; only rows that actually
+        # contain a paren are rewritten, so paren-free leagues skip the copy
+        def _strip_team_suffix(s: pd.Series) -> pd.Series:
+            s = s.astype(str)
+            mask = s.str.contains('(', regex=False)
+            if mask.any():
+                s = s.where(~mask, s.str.split('(', n=1).str[0].str.strip())
+            return s
 
-        # Normalize names
         if not self.matchups_df.empty:
-            self.matchups_df['team1_name'] = self.matchups_df['team1_name'].apply(get_manager_name)
-            self.matchups_df['team2_name'] = self.matchups_df['team2_name'].apply(get_manager_name)
+            for col in ('team1_name', 'team2_name'):
+                self.matchups_df[col] = _strip_team_suffix(self.matchups_df[col])
         if not self.standings_df.empty:
-            self.standings_df['team_name'] = self.standings_df['team_name'].apply(get_manager_name)
+            self.standings_df['team_name'] = _strip_team_suffix(self.standings_df['team_name'])
 
-        # Determine championships
+        # Determine championships. The championship game for a season is the
+        # week-16+ playoff game between the two best-seeded teams, which
+        # distinguishes it from 3rd place and consolation games.
         if not self.standings_df.empty and not self.matchups_df.empty:
-            for season in self.standings_df['season'].unique():
-                # Get playoff teams' ranks for this season
-                season_standings = self.standings_df[self.standings_df['season'] == season]
-                team_ranks = dict(zip(season_standings['team_name'], season_standings['rank']))
-
-                # Get all games marked as championship (week 16+)
-                champ_games = self.matchups_df[
-                    (self.matchups_df['season'] == season) &
-                    (self.matchups_df['is_championship'])
-                ]
-
-                if champ_games.empty:
-                    continue
-
-                # Find the actual championship game:
-                # It's the one between the two highest-ranked (lowest rank number) teams
-                # This distinguishes it from 3rd place, 5th place, and consolation games
-                best_matchup = None
-                best_combined_rank = float('inf')
-
-                for _, m in champ_games.iterrows():
-                    t1_rank = team_ranks.get(m['team1_name'], 99)
-                    t2_rank = team_ranks.get(m['team2_name'], 99)
-                    combined_rank = t1_rank + t2_rank
-
-                    # The championship should be between top-seeded teams (lowest ranks)
-                    if combined_rank < best_combined_rank:
-                        best_combined_rank = combined_rank
-                        best_matchup = m
-
-                if best_matchup is not None:
-                    winner = best_matchup['team1_name'] if best_matchup['score1'] > best_matchup['score2'] else best_matchup['team2_name']
-                    loser = best_matchup['team2_name'] if best_matchup['score1'] > best_matchup['score2'] else best_matchup['team1_name']
-
-                    self.standings_df.loc[
-                        (self.standings_df['season'] == season) &
-                        (self.standings_df['team_name'] == winner),
-                        'won_championship'
-                    ] = True
-                    self.standings_df.loc[
-                        (self.standings_df['season'] == season) &
-                        (self.standings_df['team_name'].isin([winner, loser])),
-                        'finals_appearance'
-                    ] = True
+            champ_games = self.matchups_df[self.matchups_df['is_championship']].copy()
+
+            if not champ_games.empty:
+                rank_map = self.standings_df.set_index(['season', 'team_name'])['rank']
+                # Duplicate display names within a season (e.g. several
+                # hidden profiles) would make reindex raise; keep the last
+                # entry, matching the old dict-based lookup
+                rank_map = rank_map[~rank_map.index.duplicated(keep='last')]
+                t1_rank = rank_map.reindex(
+                    pd.MultiIndex.from_arrays([champ_games['season'], champ_games['team1_name']])
+                ).fillna(99).values
+                t2_rank = rank_map.reindex(
+                    pd.MultiIndex.from_arrays([champ_games['season'], champ_games['team2_name']])
+                ).fillna(99).values
+                champ_games['combined_rank'] = t1_rank + t2_rank
+
+                # One game per season: the lowest combined seed
+                best = champ_games.loc[champ_games.groupby('season', sort=False, observed=True)['combined_rank'].idxmin()]
+
+                # Plain NumPy selection; one vectorized pass over the score
+                # arrays already saturates this step, so no JIT kernel needed
+                team1_won = best['score1'].values > best['score2'].values
+                winners = np.where(team1_won, best['team1_name'], best['team2_name'])
+                losers = np.where(team1_won, best['team2_name'], best['team1_name'])
+                seasons = best['season'].values
+
+                # Two hashed membership tests flag every row at once; rows
+                # whose (season, team) never reached a final stay False
+                rows_idx = pd.MultiIndex.from_frame(self.standings_df[['season', 'team_name']])
+                win_idx = pd.MultiIndex.from_arrays([seasons, winners])
+                finalist_idx = win_idx.append(pd.MultiIndex.from_arrays([seasons, losers]))
+                self.standings_df['won_championship'] = rows_idx.isin(win_idx)
+                self.standings_df['finals_appearance'] = rows_idx.isin(finalist_idx)
+
+        # Dictionary-encode the id/name key columns so downstream groupbys in
+        # the analysis modules hash small integer codes instead of strings
+        if not self.matchups_df.empty:
+            cat_cols = ['team1_id', 'team2_id', 'team1_name', 'team2_name']
+            self.matchups_df[cat_cols] = self.matchups_df[cat_cols].astype('category')
+        if not self.standings_df.empty:
+            cat_cols = ['team_id', 'team_name', 'manager']
+            self.standings_df[cat_cols] = self.standings_df[cat_cols].astype('category')
+
+        # Invalidate the per-season slice index; get_season_matchups
+        # rebuilds it on first use so reports that never slice by season
+        # skip the sort-and-copy entirely
+        self._matchups_idx = None
+
+        # Cache the manager roster once; the title page and analysis sections
+        # would otherwise re-derive it with repeated unique() scans
+        if not self.matchups_df.empty:
+            self.unique_managers = pd.unique(np.concatenate([
+                self.matchups_df['team1_name'].astype(str).values,
+                self.matchups_df['team2_name'].astype(str).values,
+            ]))
+        self.team_count = len(self.unique_managers)
 
         self.seasons = sorted(self.matchups_df['season'].unique()) if not self.matchups_df.empty else []
 
+    def get_season_matchups(self, season: int) -> pd.DataFrame:
+        """Return the matchups for one season as a contiguous index slice.
+
+        The sorted (season, is_championship) index is built on first use
+        and reused for later calls.
+        """
+        if self._matchups_idx is None:
+            self._matchups_idx = (
+                self.matchups_df.set_index(['season', 'is_championship'], drop=False).sort_index()
+                if not self.matchups_df.empty else pd.DataFrame()
+            )
+        try:
+            return self._matchups_idx.loc[(season, slice(None)), :]
+        except KeyError:
+            return self.matchups_df.iloc[0:0]
+
     async def generate_pdf(self, league_name: str, output_path: Path):
-        """Generate the comprehensive PDF report."""
+        """Generate the comprehensive PDF report.
+
+        matplotlib and reportlab are imported here rather than at module
+        level so callers that only fetch data (JSON endpoints, workers that
+        never render) skip the ~1s import cost.
+        """
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+
+        from reportlab.lib.pagesizes import letter, landscape
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.platypus import (
+            SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak,
+            KeepTogether, HRFlowable
+        )
+
+        from charts import create_h2h_heatmap, create_yearly_scoring_chart
+        from tables import COLORS, create_styled_table, format_dataframe_for_pdf, create_h2h_matrix_table
+
         doc = SimpleDocTemplate(
             str(output_path),
             pagesize=landscape(letter),
@@ -583,7 +756,7 @@ class ReportGenerator:
                 styles['Normal']
             ))
 
-        team_count = len(self.matchups_df["team1_name"].unique()) if not self.matchups_df.empty else 0
+        team_count = self.team_count
         if team_count:
             elements.append(Paragraph(f"{team_count} Managers", styles['Normal']))
 
@@ -603,6 +776,7 @@ class ReportGenerator:
         if not h2h_numeric.empty:
             chart_buf = create_h2h_heatmap(h2h_numeric)
             add_chart(chart_buf, width=7.0, height=5.0, title="Win Percentage Heatmap")
+            chart_buf = None  # the reportlab Image holds the only reference now
 
         if not h2h_matrix.empty:
             table = create_h2h_matrix_table(h2h_matrix)
@@ -610,6 +784,7 @@ class ReportGenerator:
                 elements.append(Paragraph("Detailed Win-Loss Records", subsection_style))
                 elements.append(table)
                 elements.append(Spacer(1, 0.15 * inch))
+        del h2h_matrix, h2h_numeric
 
         # ===== Section 2: Scoring Leaders =====
         add_section("2. Scoring Leaders")
@@ -857,6 +1032,7 @@ class ReportGenerator:
                 title="Total Points by Manager Over Time"
             )
             add_chart(yearly_chart, width=9.5, height=5.5, title="Yearly Scoring Totals")
+            yearly_chart = None
 
         # Total moves by manager
         if not self.trades_df.empty or not self.adds_df.empty:
@@ -1,6 +1,12 @@
 """Sleeper Fantasy API client for web application."""
 
+import asyncio
+import time
+from operator import itemgetter
+
 import httpx
+import numpy as np
+import orjson
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
@@ -27,6 +33,30 @@ class SleeperUser:
         )
 
 
+# Shared fallback for rosters with a null settings payload, so the hot
+# loop never allocates a throwaway dict
+_EMPTY_SETTINGS = {}
+
+
+def _cache_ttl(endpoint: str) -> Optional[float]:
+    """Seconds a response for this endpoint may be served from cache.
+
+    None means never cache. League settings and past-week matchups are
+    effectively immutable for the life of a report job; users/rosters only
+    drift slowly. Transactions are left uncached.
+    """
+    if endpoint == "state/nfl":
+        return 600.0
+    if "/matchups/" in endpoint:
+        return 3600.0
+    if endpoint.endswith("/users") or endpoint.endswith("/rosters"):
+        return 300.0
+    if endpoint.startswith("league/") and endpoint.count("/") == 1:
+        # league/{id} settings
+        return 3600.0
+    return None
+
+
 class SleeperFantasyAPI:
     """Sleeper Fantasy API client."""
 
@@ -34,15 +64,66 @@ class SleeperFantasyAPI:
 
     def __init__(self, user: SleeperUser):
         self.user = user
+        # One pooled client for the instance: per-request AsyncClients pay a
+        # fresh TCP+TLS handshake to api.sleeper.app on every call
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        )
+        # endpoint -> (fetched_at, payload); slow-moving endpoints are served
+        # from here within their TTL, with a per-key lock so concurrent
+        # misses coalesce into one upstream request
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "SleeperFantasyAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
 
     async def _get(self, endpoint: str) -> Any:
-        """Make GET request to Sleeper API."""
+        """Make GET request to Sleeper API, caching cacheable endpoints."""
+        ttl = _cache_ttl(endpoint)
+        if ttl is None:
+            return await self._fetch(endpoint)
+
+        cached = self._cache.get(endpoint)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        lock = self._cache_locks.setdefault(endpoint, asyncio.Lock())
+        async with lock:
+            # Re-check: another task may have populated the entry while we
+            # waited on the lock
+            cached = self._cache.get(endpoint)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            data = await self._fetch(endpoint)
+            self._cache[endpoint] = (time.monotonic(), data)
+            return data
+
+    async def _fetch(self, endpoint: str) -> Any:
+        """Issue the actual GET to the Sleeper API, retrying transient errors."""
         url = f"{self.BASE_URL}/{endpoint}"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=30.0)
+        for attempt in range(3):
+            response = await self._client.get(url)
+            if response.status_code == 429 or response.status_code >= 500:
+                if attempt < 2:
+                    # Rate limited or upstream hiccup: back off and retry
+                    # instead of killing a long history walk
+                    await asyncio.sleep(2 ** attempt)
+                    continue
             response.raise_for_status()
-            return response.json()
+            # orjson parses the raw bytes directly, skipping httpx's charset
+            # handling; Sleeper payloads are number-heavy and large
+            return orjson.loads(response.content)
 
     async def get_nfl_state(self) -> dict:
         """Get current NFL state (season, week)."""
@@ -105,32 +186,33 @@ class SleeperFantasyAPI:
         """Get rosters with W/L/points for all teams in a league."""
         rosters_data = await self._get(f"league/{league_id}/rosters")
 
-        rosters = []
-        for roster in rosters_data:
-            settings = roster.get("settings", {})
+        # Points come split into integer and decimal parts; batch the
+        # arithmetic over all rosters in one vectorized pass
+        settings_list = [roster.get("settings") or _EMPTY_SETTINGS for roster in rosters_data]
 
-            # Calculate total points (fpts is integer part, fpts_decimal is decimal part)
-            fpts = settings.get("fpts", 0) or 0
-            fpts_decimal = settings.get("fpts_decimal", 0) or 0
-            points_for = float(fpts) + (float(fpts_decimal) / 100.0)
+        def _floats(key):
+            return np.fromiter(
+                ((s.get(key, 0) or 0) for s in settings_list),
+                dtype=np.float64,
+                count=len(settings_list),
+            )
 
-            # Same for points against
-            fpts_against = settings.get("fpts_against", 0) or 0
-            fpts_against_decimal = settings.get("fpts_against_decimal", 0) or 0
-            points_against = float(fpts_against) + (float(fpts_against_decimal) / 100.0)
+        points_for = _floats("fpts") + _floats("fpts_decimal") / 100.0
+        points_against = _floats("fpts_against") + _floats("fpts_against_decimal") / 100.0
 
-            rosters.append({
+        return [
+            {
                 "roster_id": roster.get("roster_id"),
                 "owner_id": roster.get("owner_id"),
                 "wins": settings.get("wins", 0),
                 "losses": settings.get("losses", 0),
                 "ties": settings.get("ties", 0),
-                "points_for": points_for,
-                "points_against": points_against,
+                "points_for": float(pf),
+                "points_against": float(pa),
                 "players": roster.get("players", []),
-            })
-
-        return rosters
+            }
+            for roster, settings, pf, pa in zip(rosters_data, settings_list, points_for, points_against)
+        ]
 
     async def get_matchups(self, league_id: str, week: int) -> List[dict]:
         """Get matchups for a specific week."""
@@ -140,34 +222,37 @@ class SleeperFantasyAPI:
             if not matchups_data:
                 return []
 
-            # Group matchups by matchup_id
-            matchup_groups = {}
-            for matchup in matchups_data:
-                matchup_id = matchup.get("matchup_id")
-                if matchup_id is None:
-                    continue
-
-                if matchup_id not in matchup_groups:
-                    matchup_groups[matchup_id] = []
-                matchup_groups[matchup_id].append(matchup)
+            # Sleeper returns two entries per matchup_id; sorting by id puts
+            # each pair adjacent, so one walk emits the pairs without the
+            # intermediate dict-of-lists grouping
+            teams = sorted(
+                (m for m in matchups_data if m.get("matchup_id") is not None),
+                key=itemgetter("matchup_id"),
+            )
 
-            # Build matchup pairs
             result = []
-            for matchup_id, teams in matchup_groups.items():
-                if len(teams) >= 2:
-                    t1, t2 = teams[0], teams[1]
-                    result.append({
-                        "matchup_id": matchup_id,
-                        "week": week,
-                        "team1": {
-                            "roster_id": t1.get("roster_id"),
-                            "points": t1.get("points", 0) or 0,
-                        },
-                        "team2": {
-                            "roster_id": t2.get("roster_id"),
-                            "points": t2.get("points", 0) or 0,
-                        },
-                    })
+            i = 0
+            while i < len(teams) - 1:
+                t1, t2 = teams[i], teams[i + 1]
+                matchup_id = t1["matchup_id"]
+                if t2["matchup_id"] != matchup_id:
+                    # Unpaired entry (bye or malformed payload) - skip it
+                    i += 1
+                    continue
+
+                result.append({
+                    "matchup_id": matchup_id,
+                    "week": week,
+                    "team1": {
+                        "roster_id": t1.get("roster_id"),
+                        "points": t1.get("points", 0) or 0,
+                    },
+                    "team2": {
+                        "roster_id": t2.get("roster_id"),
+                        "points": t2.get("points", 0) or 0,
+                    },
+                })
+                i += 2
 
             return result
         except Exception:
@@ -202,10 +287,32 @@ class SleeperFantasyAPI:
             print(f"[Sleeper API] Error getting transactions for round {round_num}: {e}", flush=True)
             return []
 
+    async def get_matchups_range(self, league_id: str, weeks) -> List[List[dict]]:
+        """Get matchups for several weeks concurrently, in week order.
+
+        Bounded so a full-season burst doesn't trip Sleeper's rate limits;
+        within the bound the requests share the pooled connection.
+        """
+        sem = asyncio.Semaphore(8)
+
+        async def one(week):
+            async with sem:
+                return await self.get_matchups(league_id, week)
+
+        return await asyncio.gather(*(one(w) for w in weeks))
+
+    async def get_all_matchups(self, league_id: str, start: int = 1, end: int = 17) -> Dict[int, List[dict]]:
+        """Get matchups for a whole season, keyed by week."""
+        weeks = range(start, end + 1)
+        return dict(zip(weeks, await self.get_matchups_range(league_id, weeks)))
+
     async def get_league_teams(self, league_id: str) -> dict:
         """Get teams in a league (combines rosters with user info)."""
-        users = await self.get_league_users(league_id)
-        rosters = await self.get_league_rosters(league_id)
+        # Independent endpoints; overlap the two round-trips
+        users, rosters = await asyncio.gather(
+            self.get_league_users(league_id),
+            self.get_league_rosters(league_id),
+        )
 
         # Map user_id to user info
         user_map = {u["user_id"]: u for u in users}
@@ -233,8 +340,10 @@ class SleeperFantasyAPI:
 
     async def get_league_standings(self, league_id: str) -> List[dict]:
         """Get league standings."""
-        users = await self.get_league_users(league_id)
-        rosters = await self.get_league_rosters(league_id)
+        users, rosters = await asyncio.gather(
+            self.get_league_users(league_id),
+            self.get_league_rosters(league_id),
+        )
 
         # Map user_id to user info
         user_map = {u["user_id"]: u for u in users}
@@ -260,16 +369,43 @@ class SleeperFantasyAPI:
                 "rank": 0,  # Will be calculated
             })
 
-        # Sort by wins (desc), then points_for (desc) and assign ranks
-        standings.sort(key=lambda x: (-x["wins"], -x["points_for"]))
-        for i, team in enumerate(standings):
-            team["rank"] = i + 1
+        # Sort by wins (desc), then points_for (desc) and assign ranks;
+        # itemgetter builds the key tuple in C, no lambda frame per element
+        standings.sort(key=itemgetter("wins", "points_for"), reverse=True)
+        for i, team in enumerate(standings, start=1):
+            team["rank"] = i
 
         return standings
 
 
+# username -> (expires_at, user-or-None). Lookups are pure per username,
+# so repeat report runs resolve from here instead of a network round-trip;
+# 404s are cached briefly so typo bursts don't hammer Sleeper.
+_user_cache: Dict[str, Tuple[float, Optional[SleeperUser]]] = {}
+_user_cache_lock = asyncio.Lock()
+_USER_TTL = 3600.0
+_USER_NEGATIVE_TTL = 60.0
+
+
 async def lookup_user(username: str) -> Optional[SleeperUser]:
-    """Lookup a Sleeper user by username."""
+    """Lookup a Sleeper user by username, caching results with a TTL."""
+    cached = _user_cache.get(username)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+
+    async with _user_cache_lock:
+        cached = _user_cache.get(username)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        user = await _fetch_user(username)
+        ttl = _USER_TTL if user is not None else _USER_NEGATIVE_TTL
+        _user_cache[username] = (time.monotonic() + ttl, user)
+        return user
+
+
+async def _fetch_user(username: str) -> Optional[SleeperUser]:
+    """Fetch a Sleeper user by username."""
     url = f"https://api.sleeper.app/v1/user/{username}"
 
     async with httpx.AsyncClient() as client:
@@ -279,7 +415,7 @@ async def lookup_user(username: str) -> Optional[SleeperUser]:
             return None
 
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if not data:
             return None
@@ -291,6 +427,17 @@ async def lookup_user(username: str) -> Optional[SleeperUser]:
         )
 
 
+async def _prefetch(coro) -> None:
+    """Run a cache-warming coroutine, ignoring failures.
+
+    A failed prefetch just means the real request pays the latency later.
+    """
+    try:
+        await coro
+    except Exception:
+        pass
+
+
 async def discover_league_history(api: SleeperFantasyAPI, initial_league_id: str) -> Tuple[List[Tuple[str, int]], str]:
     """
     Discover all historical seasons for a league by tracing the previous_league_id chain.
@@ -336,6 +483,11 @@ async def discover_league_history(api: SleeperFantasyAPI, initial_league_id: str
             current_id = prev_id
             current_settings = prev_settings
 
+            # Warm the TTL cache for this season while the walk continues;
+            # the report build asks for users/rosters right after discovery
+            asyncio.create_task(_prefetch(api.get_league_users(prev_id)))
+            asyncio.create_task(_prefetch(api.get_league_rosters(prev_id)))
+
         except Exception as e:
             print(f"[HISTORY] Error tracing previous_league_id chain: {e}", flush=True)
             break
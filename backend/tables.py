@@ -1,5 +1,9 @@
 """Table formatting utilities for PDF reports."""
 
+import re
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 from reportlab.lib import colors
 from reportlab.lib.units import inch
@@ -25,6 +29,32 @@ COLORS = {
 }
 
 
+# Fixed-precision, signed, and percent format strings get the numpy bulk
+# path below
+_FLOAT_FMT = re.compile(r"^\{:(\+?)\.(\d+)([f%])\}$")
+
+
+def _format_column(col: pd.Series, fmt: str) -> pd.Series:
+    """Format a column of numbers as strings, leaving nulls as NaN.
+
+    "{:.Nf}" / "{:+.Nf}" / "{:.N%}" formats on numeric columns go through
+    np.char.mod, one C-level pass over the array; anything else falls back
+    to a per-element map with the bound format method.
+    """
+    m = _FLOAT_FMT.match(fmt)
+    if m and pd.api.types.is_numeric_dtype(col):
+        sign, precision, kind = m.groups()
+        vals = col.to_numpy(dtype=np.float64, na_value=np.nan)
+        if kind == '%':
+            out = np.char.mod(f"%{sign}.{precision}f%%", vals * 100.0)
+        else:
+            out = np.char.mod(f"%{sign}.{precision}f", vals)
+        out = out.astype(object)
+        out[np.isnan(vals)] = np.nan
+        return pd.Series(out, index=col.index)
+    return col.map(fmt.format, na_action='ignore')
+
+
 def format_dataframe_for_pdf(
     df: pd.DataFrame,
     columns: list = None,
@@ -47,36 +77,37 @@ def format_dataframe_for_pdf(
     if df.empty:
         return [[]]
 
-    # Select and order columns
-    if columns:
-        df = df[[c for c in columns if c in df.columns]]
-
     if max_rows:
         df = df.head(max_rows)
 
-    df = df.copy()
+    # Select and order columns; list selection materializes a fresh frame,
+    # so the explicit copy is only needed when there is no projection
+    if columns:
+        df = df[[c for c in columns if c in df.columns]]
+    else:
+        df = df.copy()
 
-    # Format specified numbers first (before renaming)
+    # Format specified numbers first (before renaming); nulls stay NaN here
+    # and get blanked out below
     if number_format:
         for col, fmt in number_format.items():
             if col in df.columns:
-                df[col] = df[col].apply(lambda x: fmt.format(x) if pd.notna(x) else "")
+                df[col] = _format_column(df[col], fmt)
 
     # Auto-format any remaining float columns to 2 decimal places
     for col in df.columns:
         if df[col].dtype in ['float64', 'float32'] and col not in (number_format or {}):
-            df[col] = df[col].apply(lambda x: f"{x:.2f}" if pd.notna(x) else "")
+            df[col] = _format_column(df[col], '{:.2f}')
 
     # Rename columns (after formatting)
     if column_names:
         df = df.rename(columns=column_names)
 
-    # Convert to list of lists
-    data = [df.columns.tolist()]
-    for _, row in df.iterrows():
-        data.append([str(v) if pd.notna(v) else "" for v in row.values])
-
-    return data
+    # Convert to list of lists: blank NaNs and stringify on the raw array,
+    # skipping the intermediate DataFrame copies a where/astype chain makes
+    arr = df.to_numpy(dtype=object)
+    arr = np.where(pd.isna(arr), "", arr.astype(str))
+    return [df.columns.tolist()] + arr.tolist()
 
 
 def create_styled_table(
@@ -123,8 +154,23 @@ def create_styled_table(
     else:
         alt_bg = COLORS['row_alt']
 
-    # Build exciting sports-style with even headers
-    style = [
+    if header_color is None and alternate_row_color is None:
+        # Default palette: reuse one cached TableStyle per font-size pair
+        table.setStyle(_styled_table_style(font_size, header_font_size))
+    else:
+        table.setStyle(TableStyle(
+            _styled_table_commands(hdr_bg, alt_bg, font_size, header_font_size)
+        ))
+    return table
+
+
+def _styled_table_commands(hdr_bg, alt_bg, font_size, header_font_size) -> list:
+    """Build the command list for create_styled_table.
+
+    ROWBACKGROUNDS cycles its colors down the body, so the commands are
+    independent of the row count and one style can serve every table.
+    """
+    return [
         # Header styling - bold dark with vibrant accent
         ("BACKGROUND", (0, 0), (-1, 0), hdr_bg),
         ("TEXTCOLOR", (0, 0), (-1, 0), COLORS['text_light']),
@@ -161,17 +207,18 @@ def create_styled_table(
 
         # Bold outer frame
         ("BOX", (0, 0), (-1, -1), 2, COLORS['primary']),
+
+        # Alternating row colors for better readability
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, alt_bg]),
     ]
 
-    # Add alternating row colors for better readability
-    for i in range(1, len(data)):
-        if i % 2 == 0:
-            style.append(("BACKGROUND", (0, i), (-1, i), alt_bg))
-        else:
-            style.append(("BACKGROUND", (0, i), (-1, i), colors.white))
 
-    table.setStyle(TableStyle(style))
-    return table
+@lru_cache(maxsize=8)
+def _styled_table_style(font_size: int, header_font_size: int) -> TableStyle:
+    """Shared default TableStyle instance for create_styled_table."""
+    return TableStyle(
+        _styled_table_commands(COLORS['primary'], COLORS['row_alt'], font_size, header_font_size)
+    )
 
 
 def create_compact_table(
@@ -197,8 +244,14 @@ def create_compact_table(
         col_widths = [0.9 * inch] * num_cols
 
     table = Table(data, colWidths=col_widths)
+    table.setStyle(_compact_table_style(font_size))
+    return table
+
 
-    style = [
+@lru_cache(maxsize=8)
+def _compact_table_style(font_size: int) -> TableStyle:
+    """Shared TableStyle for create_compact_table; row-count independent."""
+    return TableStyle([
         # Header
         ("BACKGROUND", (0, 0), (-1, 0), COLORS['primary']),
         ("TEXTCOLOR", (0, 0), (-1, 0), COLORS['text_light']),
@@ -220,15 +273,49 @@ def create_compact_table(
         # Borders
         ("BOX", (0, 0), (-1, -1), 1, COLORS['primary']),
         ("LINEBELOW", (0, 1), (-1, -2), 0.5, COLORS['border']),
-    ]
-
-    # Alternating rows
-    for i in range(1, len(data)):
-        if i % 2 == 0:
-            style.append(("BACKGROUND", (0, i), (-1, i), COLORS['row_alt']))
 
-    table.setStyle(TableStyle(style))
-    return table
+        # Alternating rows
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [None, COLORS['row_alt']]),
+    ])
+
+
+# Diagonal highlight for the H2H matrix, built once instead of per row
+_H2H_DIAGONAL_GOLD = colors.Color(1.0, 0.9, 0.6)
+
+# Static prefix of the H2H matrix style, built once at import; only the
+# data-dependent diagonal/alt-row commands are appended per call
+_H2H_BASE_STYLE = (
+    # Header row
+    ("BACKGROUND", (0, 0), (-1, 0), COLORS['primary']),
+    ("TEXTCOLOR", (0, 0), (-1, 0), COLORS['text_light']),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, 0), 9),
+    ("BOTTOMPADDING", (0, 0), (-1, 0), 6),
+    ("TOPPADDING", (0, 0), (-1, 0), 6),
+
+    # First column (team names)
+    ("BACKGROUND", (0, 1), (0, -1), COLORS['primary']),
+    ("TEXTCOLOR", (0, 1), (0, -1), COLORS['text_light']),
+    ("FONTNAME", (0, 1), (0, -1), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 1), (0, -1), 9),
+    ("ALIGN", (0, 1), (0, -1), "LEFT"),
+    ("LEFTPADDING", (0, 1), (0, -1), 6),
+
+    # Body cells
+    ("FONTNAME", (1, 1), (-1, -1), "Helvetica"),
+    ("FONTSIZE", (1, 1), (-1, -1), 9),
+    ("TEXTCOLOR", (1, 1), (-1, -1), COLORS['text_dark']),
+    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+    ("TOPPADDING", (0, 0), (-1, -1), 5),
+
+    # Borders - vibrant accent
+    ("BOX", (0, 0), (-1, -1), 2, COLORS['primary']),
+    ("LINEBELOW", (0, 0), (-1, 0), 3, COLORS['accent']),
+    ("LINEAFTER", (0, 0), (0, -1), 3, COLORS['accent']),
+    ("INNERGRID", (1, 1), (-1, -1), 0.5, COLORS['border']),
+)
 
 
 def create_h2h_matrix_table(
@@ -257,49 +344,13 @@ def create_h2h_matrix_table(
 
     table = Table(data, colWidths=col_widths)
 
-    style = [
-        # Header row
-        ("BACKGROUND", (0, 0), (-1, 0), COLORS['primary']),
-        ("TEXTCOLOR", (0, 0), (-1, 0), COLORS['text_light']),
-        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, 0), 9),
-        ("BOTTOMPADDING", (0, 0), (-1, 0), 6),
-        ("TOPPADDING", (0, 0), (-1, 0), 6),
-
-        # First column (team names)
-        ("BACKGROUND", (0, 1), (0, -1), COLORS['primary']),
-        ("TEXTCOLOR", (0, 1), (0, -1), COLORS['text_light']),
-        ("FONTNAME", (0, 1), (0, -1), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 1), (0, -1), 9),
-        ("ALIGN", (0, 1), (0, -1), "LEFT"),
-        ("LEFTPADDING", (0, 1), (0, -1), 6),
-
-        # Body cells
-        ("FONTNAME", (1, 1), (-1, -1), "Helvetica"),
-        ("FONTSIZE", (1, 1), (-1, -1), 9),
-        ("TEXTCOLOR", (1, 1), (-1, -1), COLORS['text_dark']),
-        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-        ("TOPPADDING", (0, 0), (-1, -1), 5),
-
-        # Borders - vibrant accent
-        ("BOX", (0, 0), (-1, -1), 2, COLORS['primary']),
-        ("LINEBELOW", (0, 0), (-1, 0), 3, COLORS['accent']),
-        ("LINEAFTER", (0, 0), (0, -1), 3, COLORS['accent']),
-        ("INNERGRID", (1, 1), (-1, -1), 0.5, COLORS['border']),
-    ]
-
-    # Highlight diagonal with gold accent
-    for i in range(1, len(data)):
-        style.append(("BACKGROUND", (i, i), (i, i), colors.Color(1.0, 0.9, 0.6)))
+    style = list(_H2H_BASE_STYLE)
 
-    # Alternating row backgrounds for body
+    # Alternating row backgrounds for the body in one bulk command, then
+    # the gold diagonal painted on top (later commands draw over earlier)
+    style.append(("ROWBACKGROUNDS", (1, 1), (-1, -1), [None, COLORS['row_alt']]))
     for i in range(1, len(data)):
-        if i % 2 == 0:
-            for j in range(1, num_cols):
-                if i != j:  # Don't override diagonal
-                    style.append(("BACKGROUND", (j, i), (j, i), COLORS['row_alt']))
+        style.append(("BACKGROUND", (i, i), (i, i), _H2H_DIAGONAL_GOLD))
 
     table.setStyle(TableStyle(style))
     return table
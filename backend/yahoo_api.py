@@ -1,11 +1,25 @@
 """Yahoo Fantasy API client for web application."""
 
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from operator import itemgetter
+
 import httpx
+import orjson
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 from auth import YahooTokens
 
+logger = logging.getLogger(__name__)
+
+# Opt-in dump of the first raw team payload per standings call; resolved
+# once at import so the hot loop pays a single constant check
+_DEBUG_STANDINGS = bool(int(os.environ.get("YAHOO_DEBUG_STANDINGS", "0")))
+
 
 # NFL Game IDs by year
 NFL_GAME_IDS = {
@@ -16,14 +30,76 @@ NFL_GAME_IDS = {
 }
 
 
+# Inverse mapping, built once so lookups are O(1)
+_GAME_ID_TO_YEAR = {gid: year for year, gid in NFL_GAME_IDS.items()}
+
+
 def get_year_from_game_id(game_id: int) -> Optional[int]:
     """Get year from game ID."""
-    for year, gid in NFL_GAME_IDS.items():
-        if gid == game_id:
-            return year
+    return _GAME_ID_TO_YEAR.get(game_id)
+
+
+# Observed shapes of the standings container and how to pull teams out of
+# each; the shape is stable per league, so it is probed once and reused
+_STANDINGS_EXTRACTORS = {
+    "list0": lambda c: c[0].get("teams", {}),
+    "dict0": lambda c: c["0"].get("teams", {}),
+    "dict_teams": lambda c: c["teams"],
+}
+
+
+def _probe_standings_shape(container) -> Optional[str]:
+    """Detect which of the known standings container shapes this is."""
+    if isinstance(container, list) and container:
+        return "list0"
+    if isinstance(container, dict):
+        if "0" in container:
+            return "dict0"
+        if "teams" in container:
+            return "dict_teams"
     return None
 
 
+def _merge_item_list(items) -> dict:
+    """Merge Yahoo's list-of-single-key-dicts shape into one dict.
+
+    Yahoo wraps each field of a team/transaction in its own one-key dict;
+    merging once up front replaces the per-field membership tests the
+    parsers used to run on every element.
+    """
+    merged = {}
+    for item in items:
+        if isinstance(item, dict):
+            merged.update(item)
+    return merged
+
+
+def _dig(d, *keys, default=None):
+    """Walk nested dicts without allocating a default at every level.
+
+    Chains like ``data.get("a", {}).get("b", [])`` build a fresh empty
+    dict per level even on the happy path; this does one lookup per key
+    and bails out as soon as a level is missing.
+    """
+    for key in keys:
+        d = d.get(key)
+        if d is None:
+            return default
+    return d
+
+
+def _manager_nickname(merged: dict) -> Optional[str]:
+    """Pull the first manager nickname out of a merged team dict."""
+    managers = merged.get("managers")
+    if managers:
+        return managers[0].get("manager", {}).get("nickname", "Unknown")
+    return None
+
+
+# Default query params shared by every request
+_JSON_PARAMS = {"format": "json"}
+
+
 class YahooFantasyAPI:
     """Yahoo Fantasy API client."""
 
@@ -31,6 +107,43 @@ class YahooFantasyAPI:
 
     def __init__(self, tokens: YahooTokens):
         self.tokens = tokens
+        # Bound in-flight requests so concurrent gathers stay under Yahoo's
+        # rate limits
+        self._sem = asyncio.Semaphore(5)
+        # One pooled client per instance; a fresh AsyncClient per request
+        # pays a new TCP+TLS handshake to Yahoo every call
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        )
+        # league_key -> (fetched_at, payload); settings and teams are read
+        # several times per report build but don't change mid-report
+        self._settings_cache: Dict[str, tuple] = {}
+        self._teams_cache: Dict[str, tuple] = {}
+        # league_key -> detected standings container shape
+        self._standings_shape: Dict[str, str] = {}
+        # request key -> (etag, parsed body); lets revalidation 304s skip
+        # the response body and the JSON parse entirely. LRU-bounded so a
+        # long-lived instance can't grow without limit.
+        self._etag_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    _ETAG_CACHE_MAX = 256
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses; the next calls hit Yahoo fresh."""
+        self._etag_cache.clear()
+        self._settings_cache.clear()
+        self._teams_cache.clear()
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "YahooFantasyAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
 
     def _get_headers(self) -> dict:
         """Get request headers with auth."""
@@ -42,19 +155,49 @@ class YahooFantasyAPI:
     async def _get(self, endpoint: str, params: dict = None) -> dict:
         """Make GET request to Yahoo API."""
         url = f"{self.BASE_URL}/{endpoint}"
-        if params is None:
-            params = {}
-        params["format"] = "json"
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=self._get_headers(),
-                params=params,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        # Reuse the shared default and never mutate a caller's params dict
+        merged = _JSON_PARAMS if params is None else {**params, "format": "json"}
+
+        cache_key = (endpoint, tuple(sorted(merged.items())))
+        etag_entry = self._etag_cache.get(cache_key)
+
+        async with self._sem:
+            for attempt in range(3):
+                # Headers are rebuilt per request so a refreshed access
+                # token is picked up mid-session
+                headers = self._get_headers()
+                if etag_entry:
+                    headers["If-None-Match"] = etag_entry[0]
+                response = await self._client.get(
+                    url,
+                    headers=headers,
+                    params=merged,
+                )
+                code = response.status_code
+                if code == 429 and attempt < 2:
+                    # Rate limited: back off exponentially and retry
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                if code == 304 and etag_entry:
+                    # Unchanged upstream: reuse the parsed body, no re-parse
+                    self._etag_cache.move_to_end(cache_key)
+                    return etag_entry[1]
+                if code >= 400:
+                    raise httpx.HTTPStatusError(
+                        f"HTTP {code} for {url}",
+                        request=response.request,
+                        response=response,
+                    )
+                # orjson decodes Yahoo's large nested payloads a few times
+                # faster than the stdlib parser behind response.json()
+                data = orjson.loads(response.content)
+                etag = response.headers.get("etag")
+                if etag:
+                    self._etag_cache[cache_key] = (etag, data)
+                    self._etag_cache.move_to_end(cache_key)
+                    if len(self._etag_cache) > self._ETAG_CACHE_MAX:
+                        self._etag_cache.popitem(last=False)
+                return data
 
     async def get_user_leagues(self, year: int) -> List[dict]:
         """Get user's leagues for a specific year. Returns list of {league_key, name}."""
@@ -67,35 +210,90 @@ class YahooFantasyAPI:
             leagues = []
 
             # Parse the nested structure
-            users = data.get("fantasy_content", {}).get("users", {})
-            user = users.get("0", {}).get("user", [])
+            users = _dig(data, "fantasy_content", "users") or {}
+            user = _dig(users, "0", "user") or []
 
             if len(user) > 1:
                 games = user[1].get("games", {})
-                game = games.get("0", {}).get("game", [])
+                game = _dig(games, "0", "game") or []
 
                 if len(game) > 1:
-                    leagues_data = game[1].get("leagues", {})
-                    for key, val in leagues_data.items():
-                        if key != "count" and isinstance(val, dict):
-                            league_list = val.get("league", [])
-                            if league_list and len(league_list) > 0:
-                                league_info = league_list[0]
-                                if isinstance(league_info, dict) and "league_key" in league_info:
-                                    leagues.append({
-                                        "league_key": league_info["league_key"],
-                                        "name": league_info.get("name", "Unknown League"),
-                                    })
+                    leagues = self._parse_leagues_collection(game[1].get("leagues", {}))
 
             return leagues
         except Exception as e:
             print(f"[API] Error getting leagues for {year}: {e}", flush=True)
             return []
 
+    _CACHE_TTL = 300.0  # seconds a settings/teams response stays fresh
+
+    async def get_user_leagues_multi(self, years) -> Dict[int, List[dict]]:
+        """Get the user's leagues for several seasons in one request.
+
+        The games collection accepts comma-separated game_keys, so one
+        round trip replaces a request per year.
+        """
+        years = list(years)
+        result = {year: [] for year in years}
+        game_ids = [NFL_GAME_IDS[y] for y in years if y in NFL_GAME_IDS]
+        if not game_ids:
+            return result
+
+        try:
+            keys = ",".join(str(g) for g in game_ids)
+            data = await self._get(f"users;use_login=1/games;game_keys={keys}/leagues")
+
+            users = _dig(data, "fantasy_content", "users") or {}
+            user = _dig(users, "0", "user") or []
+
+            if len(user) > 1:
+                games = user[1].get("games", {})
+                for gkey, gval in games.items():
+                    if gkey == "count" or not isinstance(gval, dict):
+                        continue
+                    game = gval.get("game", [])
+                    if len(game) < 2:
+                        continue
+
+                    game_info = game[0] if isinstance(game[0], dict) else _merge_item_list(game[0])
+                    try:
+                        year = _GAME_ID_TO_YEAR.get(int(game_info.get("game_id", 0)))
+                    except (TypeError, ValueError):
+                        year = None
+                    if year not in result:
+                        continue
+
+                    result[year] = self._parse_leagues_collection(game[1].get("leagues", {}))
+
+            return result
+        except Exception as e:
+            print(f"[API] Error getting leagues for {years}: {e}", flush=True)
+            return result
+
+    @staticmethod
+    def _parse_leagues_collection(leagues_data: dict) -> List[dict]:
+        """Parse a leagues collection into {league_key, name} dicts."""
+        leagues = []
+        for key, val in leagues_data.items():
+            if key != "count" and isinstance(val, dict):
+                league_list = val.get("league", [])
+                if league_list and len(league_list) > 0:
+                    league_info = league_list[0]
+                    if isinstance(league_info, dict) and "league_key" in league_info:
+                        leagues.append({
+                            "league_key": league_info["league_key"],
+                            "name": league_info.get("name", "Unknown League"),
+                        })
+        return leagues
+
     async def get_league_settings(self, league_key: str) -> dict:
         """Get league settings."""
+        cached = self._settings_cache.get(league_key)
+        if cached and time.monotonic() - cached[0] < self._CACHE_TTL:
+            return cached[1]
+
         data = await self._get(f"league/{league_key}/settings")
-        league_data = data.get("fantasy_content", {}).get("league", [])
+        league_data = _dig(data, "fantasy_content", "league") or []
 
         result = {}
         # First element is league info
@@ -106,36 +304,45 @@ class YahooFantasyAPI:
         elif league_data and isinstance(league_data[0], dict):
             result.update(league_data[0])
 
+        self._settings_cache[league_key] = (time.monotonic(), result)
         return result
 
     async def get_league_teams(self, league_key: str) -> dict:
         """Get teams in a league."""
+        cached = self._teams_cache.get(league_key)
+        if cached and time.monotonic() - cached[0] < self._CACHE_TTL:
+            return cached[1]
+
         data = await self._get(f"league/{league_key}/teams")
 
         teams = {}
-        league_data = data.get("fantasy_content", {}).get("league", [])
+        league_data = _dig(data, "fantasy_content", "league") or []
 
         if len(league_data) > 1:
             teams_data = league_data[1].get("teams", {})
             for key, val in teams_data.items():
-                if key != "count" and isinstance(val, dict):
-                    team = val.get("team", [[]])[0]
-                    team_info = {}
-                    for item in team:
-                        if isinstance(item, dict):
-                            if "team_key" in item:
-                                team_info["team_key"] = item["team_key"]
-                            elif "name" in item:
-                                team_info["name"] = item["name"]
-                            elif "managers" in item:
-                                managers = item["managers"]
-                                if managers:
-                                    mgr = managers[0].get("manager", {})
-                                    team_info["manager"] = mgr.get("nickname", "Unknown")
-
-                    if "team_key" in team_info:
-                        teams[team_info["team_key"]] = team_info
-
+                if key == "count":
+                    continue
+                # EAFP: well-formed entries always have this shape, so try
+                # the access instead of isinstance-guarding every level
+                try:
+                    merged = _merge_item_list(val["team"][0])
+                except (KeyError, TypeError, IndexError):
+                    continue
+
+                team_info = {}
+                if "team_key" in merged:
+                    team_info["team_key"] = merged["team_key"]
+                if "name" in merged:
+                    team_info["name"] = merged["name"]
+                manager = _manager_nickname(merged)
+                if manager is not None:
+                    team_info["manager"] = manager
+
+                if "team_key" in team_info:
+                    teams[team_info["team_key"]] = team_info
+
+        self._teams_cache[league_key] = (time.monotonic(), teams)
         return teams
 
     async def get_league_standings(self, league_key: str) -> List[dict]:
@@ -144,64 +351,68 @@ class YahooFantasyAPI:
         data = await self._get(f"league/{league_key}/standings")
 
         standings = []
-        league_data = data.get("fantasy_content", {}).get("league", [])
-        print(f"[STANDINGS] Fetching standings for {league_key}", flush=True)
+        league_data = _dig(data, "fantasy_content", "league") or []
+        logger.debug("[STANDINGS] Fetching standings for %s", league_key)
 
         if len(league_data) > 1:
             # Navigate to teams - handle different possible structures
             standings_container = league_data[1].get("standings", {})
 
-            # Debug: print the standings container structure
-            print(f"[STANDINGS DEBUG] standings_container type: {type(standings_container)}", flush=True)
-            if isinstance(standings_container, dict):
-                print(f"[STANDINGS DEBUG] standings_container keys: {list(standings_container.keys())[:5]}", flush=True)
-            elif isinstance(standings_container, list) and standings_container:
-                print(f"[STANDINGS DEBUG] standings_container[0] type: {type(standings_container[0])}", flush=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                # Guarded: the key/type introspection allocates slices
+                logger.debug("[STANDINGS] container type: %s", type(standings_container))
+                if isinstance(standings_container, dict):
+                    logger.debug("[STANDINGS] container keys: %s", list(standings_container.keys())[:5])
+                elif isinstance(standings_container, list) and standings_container:
+                    logger.debug("[STANDINGS] container[0] type: %s", type(standings_container[0]))
 
-            # Try to get teams from different possible structures
+            # Pull teams out of whichever container shape this league uses,
+            # probing only on the first call (or on shape drift)
             teams_data = {}
-            if isinstance(standings_container, list) and standings_container:
-                teams_data = standings_container[0].get("teams", {})
-            elif isinstance(standings_container, dict):
-                # Maybe it's standings.0.teams or just standings.teams
-                if "0" in standings_container:
-                    teams_data = standings_container["0"].get("teams", {})
-                elif "teams" in standings_container:
-                    teams_data = standings_container["teams"]
-
-            print(f"[STANDINGS DEBUG] teams_data keys: {list(teams_data.keys())[:5] if isinstance(teams_data, dict) else 'not a dict'}", flush=True)
-
-            first_printed = False
+            shape = self._standings_shape.get(league_key)
+            if shape is not None:
+                try:
+                    teams_data = _STANDINGS_EXTRACTORS[shape](standings_container)
+                except (KeyError, IndexError, TypeError):
+                    shape = None
+            if shape is None:
+                shape = _probe_standings_shape(standings_container)
+                if shape is not None:
+                    self._standings_shape[league_key] = shape
+                    teams_data = _STANDINGS_EXTRACTORS[shape](standings_container)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[STANDINGS] teams_data keys: %s",
+                             list(teams_data.keys())[:5] if isinstance(teams_data, dict) else "not a dict")
+
+            first_logged = False
 
             for key, val in teams_data.items():
                 if key != "count" and isinstance(val, dict):
                     team = val.get("team", [])
                     team_info = {}
 
-                    # Debug: print raw team structure for first team
-                    if not first_printed:
-                        print(f"[STANDINGS DEBUG] Raw team structure (first 2 elements): {team[:2] if isinstance(team, list) else team}", flush=True)
+                    # Opt-in: dump the raw structure of the first team
+                    if _DEBUG_STANDINGS and not first_logged:
+                        logger.debug("[STANDINGS] raw team structure (first 2 elements): %s",
+                                     team[:2] if isinstance(team, list) else team)
                         if isinstance(team, list) and len(team) > 1:
-                            print(f"[STANDINGS DEBUG] team[1] content: {team[1]}", flush=True)
-                        first_printed = True
+                            logger.debug("[STANDINGS] team[1] content: %s", team[1])
+                        first_logged = True
 
                     # Parse team info from team[0]
                     if team and len(team) > 0 and isinstance(team[0], list):
-                        for item in team[0]:
-                            if isinstance(item, dict):
-                                if "team_key" in item:
-                                    team_info["team_key"] = item["team_key"]
-                                elif "name" in item:
-                                    team_info["name"] = item["name"]
-                                elif "managers" in item:
-                                    managers = item["managers"]
-                                    if managers:
-                                        mgr = managers[0].get("manager", {})
-                                        team_info["manager"] = mgr.get("nickname", "Unknown")
-                                # Check if team_standings is directly in the team info items
-                                elif "team_standings" in item:
-                                    standings_info = item["team_standings"]
-                                    self._parse_standings_info(team_info, standings_info)
+                        merged = _merge_item_list(team[0])
+                        if "team_key" in merged:
+                            team_info["team_key"] = merged["team_key"]
+                        if "name" in merged:
+                            team_info["name"] = merged["name"]
+                        manager = _manager_nickname(merged)
+                        if manager is not None:
+                            team_info["manager"] = manager
+                        # team_standings is sometimes inlined with the team info
+                        if "team_standings" in merged:
+                            self._parse_standings_info(team_info, merged["team_standings"])
 
                     # Parse standings info from team[1] if not found above
                     if "rank" not in team_info and len(team) > 1 and isinstance(team[1], dict):
@@ -217,7 +428,9 @@ class YahooFantasyAPI:
 
                         self._parse_standings_info(team_info, standings_info)
 
-                    print(f"[STANDINGS] Team: {team_info.get('name', 'Unknown')}, Rank: {team_info.get('rank', 0)}, W: {team_info.get('wins', 0)}", flush=True)
+                    logger.debug("[STANDINGS] Team: %s, Rank: %s, W: %s",
+                                 team_info.get("name", "Unknown"), team_info.get("rank", 0),
+                                 team_info.get("wins", 0))
 
                     standings.append(team_info)
 
@@ -228,74 +441,105 @@ class YahooFantasyAPI:
         if not standings_info:
             return
 
-        rank_val = standings_info.get("rank", 0)
-        team_info["rank"] = int(rank_val) if rank_val else 0
-        team_info["points_for"] = float(standings_info.get("points_for", 0))
-        team_info["points_against"] = float(standings_info.get("points_against", 0))
+        # `or 0` folds Yahoo's empty-string placeholders to 0 before the cast
+        g = standings_info.get
+        team_info["rank"] = int(g("rank") or 0)
+        team_info["points_for"] = float(g("points_for") or 0)
+        team_info["points_against"] = float(g("points_against") or 0)
 
-        outcomes = standings_info.get("outcome_totals", {})
-        team_info["wins"] = int(outcomes.get("wins", 0))
-        team_info["losses"] = int(outcomes.get("losses", 0))
-        team_info["ties"] = int(outcomes.get("ties", 0))
+        og = (g("outcome_totals") or {}).get
+        team_info["wins"] = int(og("wins") or 0)
+        team_info["losses"] = int(og("losses") or 0)
+        team_info["ties"] = int(og("ties") or 0)
 
     async def get_matchups(self, league_key: str, week: int) -> List[dict]:
         """Get matchups for a specific week."""
         try:
             data = await self._get(f"league/{league_key}/scoreboard;week={week}")
+            return self._parse_scoreboard(data, week)
+        except Exception:
+            return []
 
-            matchups = []
-            league_data = data.get("fantasy_content", {}).get("league", [])
+    async def get_matchups_batch(self, league_key: str, weeks) -> Dict[int, List[dict]]:
+        """Get matchups for several weeks in one scoreboard request.
 
-            if len(league_data) > 1:
-                scoreboard = league_data[1].get("scoreboard", {})
-                matchups_data = scoreboard.get("0", {}).get("matchups", {})
+        The scoreboard endpoint accepts comma-separated weeks, so a whole
+        season is one round trip instead of one per week.
+        """
+        weeks = list(weeks)
+        result = {week: [] for week in weeks}
+        try:
+            week_param = ",".join(str(w) for w in weeks)
+            data = await self._get(f"league/{league_key}/scoreboard;week={week_param}")
+            for matchup in self._parse_scoreboard(data, weeks[0] if weeks else 0):
+                result.setdefault(matchup["week"], []).append(matchup)
+            return result
+        except Exception:
+            return result
 
-                for key, val in matchups_data.items():
-                    if key == "count" or not isinstance(val, dict):
-                        continue
+    async def get_season_matchups(self, league_key: str, weeks) -> List[List[dict]]:
+        """Get matchups for several weeks, ordered like ``weeks``.
 
-                    matchup = val.get("matchup", {})
-                    teams_data = matchup.get("0", {}).get("teams", {})
+        Delegates to get_matchups_batch, so the whole span is one request
+        rather than a fan-out of per-week calls.
+        """
+        weeks = list(weeks)
+        by_week = await self.get_matchups_batch(league_key, weeks)
+        return [by_week.get(week, []) for week in weeks]
 
-                    t1_data = teams_data.get("0")
-                    t2_data = teams_data.get("1")
+    def _parse_scoreboard(self, data: dict, default_week: int) -> List[dict]:
+        """Parse a scoreboard payload into matchup dicts."""
+        matchups = []
+        league_data = _dig(data, "fantasy_content", "league") or []
 
-                    if not t1_data or not t2_data:
-                        continue
+        if len(league_data) > 1:
+            scoreboard = league_data[1].get("scoreboard", {})
+            matchups_data = _dig(scoreboard, "0", "matchups") or {}
 
-                    t1 = self._parse_team_matchup(t1_data)
-                    t2 = self._parse_team_matchup(t2_data)
+            for key, val in matchups_data.items():
+                if key == "count" or not isinstance(val, dict):
+                    continue
 
-                    is_playoff = matchup.get("is_playoffs", "0") == "1"
+                matchup = val.get("matchup", {})
+                teams_data = _dig(matchup, "0", "teams") or {}
 
-                    matchups.append({
-                        "week": week,
-                        "team1": t1,
-                        "team2": t2,
-                        "is_playoff": is_playoff,
-                    })
+                t1_data = teams_data.get("0")
+                t2_data = teams_data.get("1")
 
-            return matchups
-        except Exception:
-            return []
+                if not t1_data or not t2_data:
+                    continue
+
+                t1 = self._parse_team_matchup(t1_data)
+                t2 = self._parse_team_matchup(t2_data)
+
+                is_playoff = matchup.get("is_playoffs", "0") == "1"
+
+                matchups.append({
+                    "week": int(matchup.get("week", default_week)),
+                    "team1": t1,
+                    "team2": t2,
+                    "is_playoff": is_playoff,
+                })
+
+        return matchups
 
     def _parse_team_matchup(self, team_data: dict) -> dict:
         """Parse team data from matchup."""
         info = {}
         team = team_data.get("team", [])
 
-        if team and len(team) > 0:
-            for item in team[0]:
-                if isinstance(item, dict):
-                    if "team_key" in item:
-                        info["team_key"] = item["team_key"]
-                    elif "name" in item:
-                        info["name"] = item["name"]
-                    elif "managers" in item:
-                        managers = item["managers"]
-                        if managers:
-                            mgr = managers[0].get("manager", {})
-                            info["manager"] = mgr.get("nickname", "Unknown")
+        try:
+            merged = _merge_item_list(team[0])
+        except (TypeError, IndexError):
+            return info
+
+        if "team_key" in merged:
+            info["team_key"] = merged["team_key"]
+        if "name" in merged:
+            info["name"] = merged["name"]
+        manager = _manager_nickname(merged)
+        if manager is not None:
+            info["manager"] = manager
 
         if len(team) > 1:
             info["points"] = float(team[1].get("team_points", {}).get("total", 0))
@@ -310,24 +554,21 @@ class YahooFantasyAPI:
             )
 
             transactions = []
-            league_data = data.get("fantasy_content", {}).get("league", [])
+            league_data = _dig(data, "fantasy_content", "league") or []
 
             if len(league_data) > 1:
                 trans_data = league_data[1].get("transactions", {})
 
                 for key, val in trans_data.items():
-                    if key == "count" or not isinstance(val, dict):
+                    if key == "count":
                         continue
 
-                    transaction = val.get("transaction", [])
-                    if not transaction:
+                    try:
+                        transaction = val["transaction"]
+                        txn_info = _merge_item_list(transaction[0])
+                    except (KeyError, TypeError, IndexError):
                         continue
 
-                    txn_info = {}
-                    for item in transaction[0]:
-                        if isinstance(item, dict):
-                            txn_info.update(item)
-
                     if len(transaction) > 1:
                         txn_info["players"] = transaction[1].get("players", {})
 
@@ -402,8 +643,8 @@ async def discover_league_history(api: YahooFantasyAPI, initial_league_key: str)
             break
 
     # Sort by year (oldest first)
-    found_leagues.sort(key=lambda x: x[1])
+    found_leagues.sort(key=itemgetter(1))
 
-    print(f"[HISTORY] Found {len(found_leagues)} seasons: {[y for _, y in found_leagues]}", flush=True)
+    print(f"[HISTORY] Found {len(found_leagues)} seasons: {list(map(itemgetter(1), found_leagues))}", flush=True)
 
     return found_leagues, league_name